@@ -1,23 +1,93 @@
 """Abstract base class for analytics metrics."""
 
+import functools
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Literal
-
-
-@dataclass
+from typing import Any, Callable, ClassVar, Literal
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Prebound so the default factory skips the per-instance attribute lookup
+_utcnow = datetime.utcnow
+
+# Short-TTL memoization of compute() results: dashboard reloads with the
+# same filters return the cached result instead of re-running the SQL and
+# aggregation. Keys include a data version bumped on every write through
+# the session (ORM flush or Core statement), so a sync invalidates all
+# cached results immediately.
+_COMPUTE_CACHE: dict[tuple, tuple[float, "AnalyticsResult"]] = {}
+_COMPUTE_CACHE_MAX = 256
+_COMPUTE_CACHE_TTL = 300  # seconds
+_data_version = 0
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_data_version(session, flush_context) -> None:
+    """Invalidate memoized results whenever rows are written."""
+    global _data_version
+    _data_version += 1
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_core_write(execute_state) -> None:
+    """Invalidate for Core DML too; the sync's bulk upserts and the
+    Util flush write via session.execute() without an ORM flush."""
+    if not execute_state.is_select:
+        global _data_version
+        _data_version += 1
+
+
+def _memoize_compute(compute):
+    """Wrap a metric's compute() with the TTL result cache."""
+
+    @functools.wraps(compute)
+    def wrapper(self, **kwargs):
+        key = (self.metric_id, _data_version, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = _COMPUTE_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        result = compute(self, **kwargs)
+        if result.error is None:
+            if len(_COMPUTE_CACHE) >= _COMPUTE_CACHE_MAX:
+                _COMPUTE_CACHE.pop(next(iter(_COMPUTE_CACHE)))
+            _COMPUTE_CACHE[key] = (now + _COMPUTE_CACHE_TTL, result)
+        return result
+
+    return wrapper
+
+
+@dataclass(slots=True)
 class AnalyticsResult:
-    """Result of computing an analytics metric."""
+    """Result of computing an analytics metric.
+
+    Slotted to avoid a per-instance __dict__; results are created on
+    every metric computation, including early-return error paths.
+    """
 
     metric_id: str
     title: str
-    computed_at: datetime = field(default_factory=datetime.utcnow)
+    computed_at: datetime = field(default_factory=_utcnow)
     data: Any = None  # Raw data (DataFrame, dict, list, etc.)
-    chart_json: str | None = None  # Plotly JSON for visualization
+    chart_renderer: Callable[[], str] | None = field(default=None, repr=False)
     table_html: str | None = None  # HTML table representation
     summary: dict = field(default_factory=dict)  # Key stats for display
     error: str | None = None
+    _chart_json: str | None = field(default=None, init=False, repr=False)
+
+    @property
+    def chart_json(self) -> str | None:
+        """Plotly JSON for visualization, rendered on first access.
+
+        Metrics pass a chart_renderer callable so summary-only consumers
+        never pay for the figure build and serialization.
+        """
+        if self._chart_json is None and self.chart_renderer is not None:
+            self._chart_json = self.chart_renderer()
+        return self._chart_json
 
 
 class AnalyticsMetric(ABC):
@@ -39,33 +109,28 @@ class AnalyticsMetric(ABC):
                 return AnalyticsResult(...)
     """
 
-    @property
-    @abstractmethod
-    def metric_id(self) -> str:
-        """Unique identifier for this metric."""
-        pass
+    #: Unique identifier for this metric.
+    metric_id: ClassVar[str]
 
-    @property
-    @abstractmethod
-    def title(self) -> str:
-        """Human-readable title for display."""
-        pass
+    #: Human-readable title for display.
+    title: ClassVar[str]
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Description of what this metric shows."""
-        pass
+    #: Description of what this metric shows.
+    description: ClassVar[str]
 
-    @property
-    @abstractmethod
-    def category(self) -> Literal["trends", "impact"]:
-        """Category this metric belongs to.
+    #: Category this metric belongs to.
+    #: - 'trends': Organization-wide CVE impact (Vulnerability Trends)
+    #: - 'impact': Per-CVE blast radius (Vulnerability Impact)
+    category: ClassVar[Literal["trends", "impact"]]
 
-        - 'trends': Organization-wide CVE impact (Vulnerability Trends)
-        - 'impact': Per-CVE blast radius (Vulnerability Impact)
-        """
-        pass
+    def __init_subclass__(cls, **kwargs):
+        """Enforce that concrete metrics declare their metadata."""
+        super().__init_subclass__(**kwargs)
+        for attr in ("metric_id", "title", "description", "category"):
+            if not getattr(cls, attr, None):
+                raise TypeError(f"{cls.__name__} must define {attr}")
+        if "compute" in cls.__dict__:
+            cls.compute = _memoize_compute(cls.compute)
 
     @abstractmethod
     def compute(self, **kwargs) -> AnalyticsResult:
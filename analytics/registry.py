@@ -1,5 +1,6 @@
 """Auto-discovery registry for analytics metrics."""
 
+from collections import defaultdict
 from typing import Type
 from analytics.base import AnalyticsMetric
 
@@ -8,6 +9,9 @@ class AnalyticsRegistry:
     """Registry for analytics metric implementations."""
 
     _metrics: dict[str, Type[AnalyticsMetric]] = {}
+    _by_category: dict[str, list[Type[AnalyticsMetric]]] = defaultdict(list)
+    _metadata_by_category: dict[str, list[dict]] = defaultdict(list)
+    _discovered = False
 
     @classmethod
     def register(cls, metric_class: Type[AnalyticsMetric]) -> Type[AnalyticsMetric]:
@@ -24,12 +28,27 @@ class AnalyticsRegistry:
         Returns:
             The registered class (for decorator use).
         """
-        metric_id = metric_class.metric_id.fget(None)  # type: ignore
+        metric_id = getattr(metric_class, "metric_id", None)
         if metric_id is None:
             raise ValueError(
-                f"{metric_class.__name__} must define metric_id property"
+                f"{metric_class.__name__} must define metric_id"
             )
         cls._metrics[metric_id] = metric_class
+
+        # Bucket by category at registration time so get_by_category is an
+        # O(1) lookup instead of a scan over all registered metrics
+        cls._by_category[metric_class.category].append(metric_class)
+
+        # Display metadata is static class data; build the dict once
+        # here instead of per request in the index views
+        cls._metadata_by_category[metric_class.category].append(
+            {
+                "id": metric_class.metric_id,
+                "title": metric_class.title,
+                "description": metric_class.description,
+            }
+        )
+
         return metric_class
 
     @classmethod
@@ -54,12 +73,20 @@ class AnalyticsRegistry:
         Returns:
             List of AnalyticsMetric subclasses in the category.
         """
-        result = []
-        for metric_class in cls._metrics.values():
-            cat = metric_class.category.fget(None)  # type: ignore
-            if cat == category:
-                result.append(metric_class)
-        return result
+        return list(cls._by_category.get(category, ()))
+
+    @classmethod
+    def get_metadata_by_category(cls, category: str) -> list[dict]:
+        """Get display metadata for all metrics in a category.
+
+        Args:
+            category: Category name ('trends' or 'impact').
+
+        Returns:
+            List of {id, title, description} dicts built at
+            registration time.
+        """
+        return cls._metadata_by_category.get(category, [])
 
     @classmethod
     def get_all(cls) -> dict[str, Type[AnalyticsMetric]]:
@@ -84,8 +111,13 @@ class AnalyticsRegistry:
         """Import all metric modules to trigger registration.
 
         Call this during application startup to ensure all metrics
-        are registered.
+        are registered. Idempotent: repeat calls (one per view today)
+        return immediately after the first discovery.
         """
+        if cls._discovered:
+            return
+        cls._discovered = True
+
         # Import metric modules to trigger @register decorators
         try:
             import analytics.trends  # noqa: F401
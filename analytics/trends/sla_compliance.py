@@ -3,6 +3,11 @@
 from datetime import datetime, timedelta
 from typing import Literal
 
+from sqlalchemy import case, func
+
+from app.extensions import db
+from app.models import Project, Team, Tracker
+
 from analytics.base import AnalyticsMetric, AnalyticsResult
 from analytics.registry import AnalyticsRegistry
 from analytics.visualizations import PieChart, BarChart
@@ -12,28 +17,17 @@ from analytics.visualizations import PieChart, BarChart
 class SLAComplianceMetric(AnalyticsMetric):
     """Track SLA compliance for CVE trackers."""
 
-    @property
-    def metric_id(self) -> str:
-        return "sla_compliance"
-
-    @property
-    def title(self) -> str:
-        return "SLA Compliance"
-
-    @property
-    def description(self) -> str:
-        return "Percentage of trackers resolved within SLA timeframe"
-
-    @property
-    def category(self) -> Literal["trends", "impact"]:
-        return "trends"
+    metric_id = "sla_compliance"
+    title = "SLA Compliance"
+    description = "Percentage of trackers resolved within SLA timeframe"
+    category: Literal["trends", "impact"] = "trends"
 
     def _parse_date(self, date_str: str | None, default: datetime) -> datetime:
         """Parse date string to datetime, returning default if invalid."""
         if not date_str:
             return default
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
+            return datetime.fromisoformat(date_str)
         except (ValueError, TypeError):
             return default
 
@@ -44,9 +38,6 @@ class SLAComplianceMetric(AnalyticsMetric):
             date_range_start: Start of date range.
             date_range_end: End of date range.
         """
-        from app.extensions import db
-        from app.models import Tracker
-
         default_start = datetime.utcnow() - timedelta(days=90)
         default_end = datetime.utcnow()
 
@@ -54,25 +45,37 @@ class SLAComplianceMetric(AnalyticsMetric):
         end_date = self._parse_date(kwargs.get("date_range_end"), default_end)
 
         try:
-            resolved_trackers = db.session.query(Tracker).filter(
+            resolved_in_range = (
                 Tracker.resolved_date.isnot(None),
                 Tracker.resolved_date >= start_date,
                 Tracker.resolved_date <= end_date,
-            ).all()
-
-            # Calculate SLA compliance using per-tracker sla_date
-            within_sla = 0
-            breached = 0
-            no_sla = 0
-
-            for tracker in resolved_trackers:
-                if tracker.resolved_date and tracker.sla_date:
-                    if tracker.resolved_date <= tracker.sla_date:
-                        within_sla += 1
-                    else:
-                        breached += 1
-                else:
-                    no_sla += 1
+            )
+
+            # SLA compliance using per-tracker sla_date, rolled up in SQL
+            # instead of loading every resolved tracker into Python
+            has_sla = Tracker.sla_date.isnot(None)
+            within_expr = case(
+                ((has_sla) & (Tracker.resolved_date <= Tracker.sla_date), 1),
+                else_=0,
+            )
+            breached_expr = case(
+                ((has_sla) & (Tracker.resolved_date > Tracker.sla_date), 1),
+                else_=0,
+            )
+            no_sla_expr = case((Tracker.sla_date.is_(None), 1), else_=0)
+
+            within_sla, breached, no_sla = (
+                db.session.query(
+                    func.sum(within_expr),
+                    func.sum(breached_expr),
+                    func.sum(no_sla_expr),
+                )
+                .filter(*resolved_in_range)
+                .one()
+            )
+            within_sla = int(within_sla or 0)
+            breached = int(breached or 0)
+            no_sla = int(no_sla or 0)
 
             total = within_sla + breached
             compliance_rate = (within_sla / total * 100) if total > 0 else 0
@@ -83,14 +86,30 @@ class SLAComplianceMetric(AnalyticsMetric):
                 "values": [within_sla, breached],
             }
 
-            pie_chart = PieChart()
-            chart_json = pie_chart.render_json(
-                pie_data,
-                title="SLA Compliance",
+            # Rendered lazily on first chart_json access
+            def render_chart() -> str:
+                return PieChart().render_json(pie_data, title="SLA Compliance")
+
+            # By-team breakdown: one grouped query replaces the per-row
+            # project->team dereferences
+            team_rows = (
+                db.session.query(
+                    Team.name,
+                    func.sum(within_expr),
+                    func.sum(breached_expr),
+                )
+                .select_from(Tracker)
+                .join(Project, Tracker.project_id == Project.id)
+                .join(Team, Project.team_id == Team.id)
+                .filter(*resolved_in_range)
+                .group_by(Team.name)
+                .all()
             )
-
-            # By-team breakdown if we have team data
-            team_data = self._compute_by_team(resolved_trackers)
+            team_data = {
+                "labels": [name for name, _, _ in team_rows],
+                "within_sla": [int(w or 0) for _, w, _ in team_rows],
+                "breached": [int(b or 0) for _, _, b in team_rows],
+            }
 
             return AnalyticsResult(
                 metric_id=self.metric_id,
@@ -99,7 +118,7 @@ class SLAComplianceMetric(AnalyticsMetric):
                     "pie": pie_data,
                     "by_team": team_data,
                 },
-                chart_json=chart_json,
+                chart_renderer=render_chart,
                 summary={
                     "total_resolved": total,
                     "within_sla": within_sla,
@@ -116,30 +135,6 @@ class SLAComplianceMetric(AnalyticsMetric):
                 error=str(e),
             )
 
-    def _compute_by_team(self, trackers: list) -> dict:
-        """Compute SLA compliance breakdown by team."""
-        teams = {}
-
-        for tracker in trackers:
-            if not tracker.project or not tracker.project.team:
-                continue
-
-            team_name = tracker.project.team.name
-            if team_name not in teams:
-                teams[team_name] = {"within": 0, "breached": 0}
-
-            if tracker.resolved_date and tracker.sla_date:
-                if tracker.resolved_date <= tracker.sla_date:
-                    teams[team_name]["within"] += 1
-                else:
-                    teams[team_name]["breached"] += 1
-
-        return {
-            "labels": list(teams.keys()),
-            "within_sla": [t["within"] for t in teams.values()],
-            "breached": [t["breached"] for t in teams.values()],
-        }
-
     def get_filter_options(self) -> dict:
         return {
             "time_range": {
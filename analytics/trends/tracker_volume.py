@@ -1,41 +1,40 @@
 """Tracker volume metric."""
 
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Literal
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import case, func
+
+from app.extensions import db
+from app.models import Tracker
 
 from analytics.base import AnalyticsMetric, AnalyticsResult
 from analytics.registry import AnalyticsRegistry
 from analytics.visualizations import LineChart
 
+# Resolutions that indicate the tracker should never have been filed
+# (compared lowercased)
+_INACCURATE_RESOLUTIONS = frozenset({"obsolete", "won't do", "not a bug", "duplicate"})
+
 
 @AnalyticsRegistry.register
 class TrackerVolumeMetric(AnalyticsMetric):
     """Track the volume of CVE trackers over time."""
 
-    @property
-    def metric_id(self) -> str:
-        return "tracker_volume"
-
-    @property
-    def title(self) -> str:
-        return "Tracker Volume"
-
-    @property
-    def description(self) -> str:
-        return "Number of open and closed CVE trackers over time"
-
-    @property
-    def category(self) -> Literal["trends", "impact"]:
-        return "trends"
+    metric_id = "tracker_volume"
+    title = "Tracker Volume"
+    description = "Number of open and closed CVE trackers over time"
+    category: Literal["trends", "impact"] = "trends"
 
     def _parse_date(self, date_str: str | None, default: datetime) -> datetime:
         """Parse date string to datetime, returning default if invalid."""
         if not date_str:
             return default
         try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
+            return datetime.fromisoformat(date_str)
         except (ValueError, TypeError):
             return default
 
@@ -47,9 +46,6 @@ class TrackerVolumeMetric(AnalyticsMetric):
             date_range_end: End of date range.
             show_severity: Whether to show severity breakdown lines.
         """
-        from app.extensions import db
-        from app.models import Tracker
-
         default_start = datetime.utcnow() - timedelta(days=90)
         default_end = datetime.utcnow()
 
@@ -58,55 +54,85 @@ class TrackerVolumeMetric(AnalyticsMetric):
         show_severity = kwargs.get("show_severity") == "on"
 
         try:
-            trackers = db.session.query(Tracker).filter(
-                Tracker.created_date >= start_date,
-                Tracker.created_date <= end_date,
-            ).all()
+            # Stream just the columns the series needs instead of
+            # materializing full ORM rows for the whole window; severity
+            # is only fetched when the breakdown lines are requested
+            columns = [Tracker.created_date, Tracker.resolved_date]
+            if show_severity:
+                columns.append(Tracker.severity)
+            rows = (
+                db.session.query(*columns)
+                .filter(
+                    Tracker.created_date >= start_date,
+                    Tracker.created_date <= end_date,
+                )
+                .yield_per(1000)
+            )
+
+            created_dates: list = []
+            resolved_dates: list = []
+            sev_created: dict[str, list] = defaultdict(list)
+            sev_resolved: dict[str, list] = defaultdict(list)
+            if show_severity:
+                for created, resolved, severity in rows:
+                    created_dates.append(created)
+                    if resolved:
+                        resolved_dates.append(resolved)
+                    if severity:
+                        sev_created[severity].append(created)
+                        if resolved:
+                            sev_resolved[severity].append(resolved)
+            else:
+                for created, resolved in rows:
+                    created_dates.append(created)
+                    if resolved:
+                        resolved_dates.append(resolved)
 
             # Build time series data
             date_range = pd.date_range(start=start_date, end=end_date, freq="W")
-            open_counts = []
-            closed_counts = []
-
-            # Severity breakdown counts
-            critical_counts = []
-            important_counts = []
-            moderate_counts = []
-
-            for week_end in date_range:
-                week_start = week_end - timedelta(days=7)
-
-                # Count open trackers at this point in time
-                open_at_week = [
-                    t for t in trackers
-                    if t.created_date
-                    and t.created_date <= week_end
-                    and (not t.resolved_date or t.resolved_date > week_end)
-                ]
-                open_counts.append(len(open_at_week))
-
-                closed_count = sum(
-                    1
-                    for t in trackers
-                    if t.resolved_date
-                    and t.resolved_date > week_start
-                    and t.resolved_date <= week_end
+
+            # Vectorized weekly bucketing: sort the created/resolved event
+            # dates once and use searchsorted against the week boundaries,
+            # replacing the O(weeks x trackers) rescan loops.
+            def sorted_events(dates: list) -> np.ndarray:
+                return np.sort(np.array(dates, dtype="datetime64[ns]"))
+
+            week_ends = date_range.values
+            week_starts = week_ends - np.timedelta64(7, "D")
+
+            def open_series(
+                created: np.ndarray, resolved: np.ndarray
+            ) -> list[int]:
+                """Open-at-week-end counts via a single sweep-line pass.
+
+                Merge +1 (created) and -1 (resolved) events, cumulative-sum
+                them in time order, then sample the running total at each
+                week end.
+                """
+                times = np.concatenate([created, resolved])
+                if times.size == 0:
+                    return [0] * len(week_ends)
+                signs = np.concatenate(
+                    [
+                        np.ones(len(created), dtype=np.int64),
+                        np.full(len(resolved), -1, dtype=np.int64),
+                    ]
                 )
-                closed_counts.append(closed_count)
-
-                # Count by severity (open trackers at this point)
-                critical_counts.append(sum(
-                    1 for t in open_at_week
-                    if t.severity and t.severity.lower() == 'critical'
-                ))
-                important_counts.append(sum(
-                    1 for t in open_at_week
-                    if t.severity and t.severity.lower() == 'important'
-                ))
-                moderate_counts.append(sum(
-                    1 for t in open_at_week
-                    if t.severity and t.severity.lower() == 'moderate'
-                ))
+                order = np.argsort(times, kind="stable")
+                cum = signs[order].cumsum()
+                idx = np.searchsorted(times[order], week_ends, side="right") - 1
+                return np.where(idx >= 0, cum[np.clip(idx, 0, None)], 0).tolist()
+
+            created_events = sorted_events(created_dates)
+            resolved_events = sorted_events(resolved_dates)
+
+            open_counts = open_series(created_events, resolved_events)
+
+            # Closed during the week = resolved in (week_start, week_end]
+            closed_counts = (
+                np.searchsorted(resolved_events, week_ends, side="right")
+                - np.searchsorted(resolved_events, week_starts, side="right")
+            ).tolist()
 
             # Build chart data
             y_series = [open_counts, closed_counts]
@@ -114,7 +140,14 @@ class TrackerVolumeMetric(AnalyticsMetric):
             line_dashes = ["solid", "solid"]
 
             if show_severity:
-                y_series.extend([critical_counts, important_counts, moderate_counts])
+                # Same open-at-week sweep per severity subset
+                for severity in ("critical", "important", "moderate"):
+                    y_series.append(
+                        open_series(
+                            sorted_events(sev_created[severity]),
+                            sorted_events(sev_resolved[severity]),
+                        )
+                    )
                 names.extend(["Critical", "Important", "Moderate"])
                 line_dashes.extend(["dash", "dash", "dash"])
 
@@ -124,23 +157,43 @@ class TrackerVolumeMetric(AnalyticsMetric):
                 "names": names,
             }
 
-            chart = LineChart()
-            chart_json = chart.render_json(
-                data,
-                title="CVE Tracker Volume Over Time",
-                x_label="Date",
-                y_label="Count",
-                line_dashes=line_dashes,
-            )
+            # Rendered lazily on first chart_json access
+            def render_chart() -> str:
+                return LineChart().render_json(
+                    data,
+                    title="CVE Tracker Volume Over Time",
+                    x_label="Date",
+                    y_label="Count",
+                    line_dashes=line_dashes,
+                )
 
-            # Count trackers closed with inaccurate resolutions
-            inaccurate_resolutions = {'obsolete', "won't do", 'not a bug', 'duplicate'}
-            inaccurate_count = sum(
-                1 for t in trackers
-                if t.resolution and t.resolution.lower() in inaccurate_resolutions
+            # Summary counts rolled up in one aggregate query instead of
+            # re-scanning the loaded trackers per count
+            open_expr = case(
+                (Tracker.status.is_(None), 1),
+                (func.lower(Tracker.status).notin_(Tracker.CLOSED_STATUSES), 1),
+                else_=0,
+            )
+            inaccurate_expr = case(
+                (func.lower(Tracker.resolution).in_(_INACCURATE_RESOLUTIONS), 1),
+                else_=0,
+            )
+            total_trackers, currently_open, inaccurate_count = (
+                db.session.query(
+                    func.count(Tracker.id),
+                    func.sum(open_expr),
+                    func.sum(inaccurate_expr),
+                )
+                .filter(
+                    Tracker.created_date >= start_date,
+                    Tracker.created_date <= end_date,
+                )
+                .one()
             )
+            currently_open = int(currently_open or 0)
+            inaccurate_count = int(inaccurate_count or 0)
 
-            total_closed = sum(1 for t in trackers if not t.is_open)
+            total_closed = total_trackers - currently_open
             accuracy_rate = round(
                 ((total_closed - inaccurate_count) / total_closed * 100) if total_closed > 0 else 100,
                 1
@@ -150,10 +203,10 @@ class TrackerVolumeMetric(AnalyticsMetric):
                 metric_id=self.metric_id,
                 title=self.title,
                 data=data,
-                chart_json=chart_json,
+                chart_renderer=render_chart,
                 summary={
-                    "total_trackers": len(trackers),
-                    "currently_open": sum(1 for t in trackers if t.is_open),
+                    "total_trackers": total_trackers,
+                    "currently_open": currently_open,
                     "closed": total_closed,
                     "inaccurate": inaccurate_count,
                     "accuracy_rate": accuracy_rate,
@@ -1,8 +1,89 @@
 """Abstract base class for visualizations."""
 
+import functools
+import hashlib
+import json
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+# Memoized render_json output keyed by a digest of (data, options):
+# dashboards re-render charts with identical inputs whenever the
+# underlying counts are unchanged, so repeat loads skip the Plotly
+# figure build and JSON serialization entirely.
+_RENDER_CACHE: dict[tuple[str, str], str] = {}
+_RENDER_CACHE_MAX = 512
+
+# Encoded payloads for render_bytes, kept separately so byte responses
+# do not pay the UTF-8 encode again on repeat requests.
+_BYTES_CACHE: dict[tuple[str, str], bytes] = {}
+_BYTES_CACHE_MAX = 128
+
+# Shared embed template. The payload sits in a non-executable
+# application/json block and goes through JSON.parse, which browsers
+# handle faster than evaluating a large object literal, and is emitted
+# once rather than interpolated for both data and layout.
+_HTML_TEMPLATE = """
+        <script id="{div_id}-data" type="application/json">{chart_json}</script>
+        <div id="{div_id}"></div>
+        <script>
+            (function() {{
+                var chart = JSON.parse(document.getElementById('{div_id}-data').textContent);
+                Plotly.newPlot('{div_id}', chart.data, chart.layout);
+            }})();
+        </script>
+        """
+
+
+def _digest_default(obj: Any) -> str:
+    """Stable string form for non-JSON values inside cache-key digests."""
+    if isinstance(obj, np.ndarray):
+        # str(array) elides elements for large arrays, which would let
+        # distinct inputs collide on one key
+        if obj.dtype == object:
+            return repr(obj.tolist())
+        return f"{obj.dtype}|{obj.shape}|{obj.tobytes().hex()}"
+    return str(obj)
+
+
+def _render_key(viz_name: str, data: Any, options: dict) -> tuple[str, str] | None:
+    """Build a cache key, or None if the inputs are not safely hashable."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr(tuple(data.columns)).encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        elif hasattr(data, "to_dict"):
+            # Other frame-likes have no cheap stable digest; render directly
+            return None
+        else:
+            digest.update(json.dumps(data, sort_keys=True, default=_digest_default).encode())
+        digest.update(json.dumps(options, sort_keys=True, default=_digest_default).encode())
+    except (TypeError, ValueError):
+        return None
+    return (viz_name, digest.hexdigest())
+
+
+def _memoize_render(render_json):
+    """Wrap a chart's render_json() with the digest-keyed cache."""
+
+    @functools.wraps(render_json)
+    def wrapper(self, data: Any, **options) -> str:
+        key = _render_key(type(self).__name__, data, options)
+        if key is None:
+            return render_json(self, data, **options)
+        cached = _RENDER_CACHE.get(key)
+        if cached is None:
+            cached = render_json(self, data, **options)
+            if len(_RENDER_CACHE) >= _RENDER_CACHE_MAX:
+                _RENDER_CACHE.pop(next(iter(_RENDER_CACHE)))
+            _RENDER_CACHE[key] = cached
+        return cached
+
+    return wrapper
+
 
 class Visualization(ABC):
     """Abstract base class for chart types.
@@ -10,6 +91,12 @@ class Visualization(ABC):
     Renders data to HTML or JSON for frontend display.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        """Memoize each concrete chart's render_json."""
+        super().__init_subclass__(**kwargs)
+        if "render_json" in cls.__dict__:
+            cls.render_json = _memoize_render(cls.render_json)
+
     @property
     @abstractmethod
     def viz_type(self) -> str:
@@ -29,15 +116,44 @@ class Visualization(ABC):
         """
         pass
 
-    @abstractmethod
+    def render_bytes(self, data: Any, **options) -> bytes:
+        """Render data to UTF-8 encoded Plotly JSON.
+
+        Routes that serve a chart payload directly can hand these bytes
+        to a Response without Flask re-encoding a str body.
+
+        Args:
+            data: Input data (DataFrame, dict, etc.)
+            **options: Visualization-specific options.
+
+        Returns:
+            JSON bytes for Plotly.
+        """
+        key = _render_key(type(self).__name__, data, options)
+        if key is None:
+            return self.render_json(data, **options).encode("utf-8")
+        cached = _BYTES_CACHE.get(key)
+        if cached is None:
+            cached = self.render_json(data, **options).encode("utf-8")
+            if len(_BYTES_CACHE) >= _BYTES_CACHE_MAX:
+                _BYTES_CACHE.pop(next(iter(_BYTES_CACHE)))
+            _BYTES_CACHE[key] = cached
+        return cached
+
     def render_html(self, data: Any, **options) -> str:
         """Render data to embeddable HTML.
 
         Args:
             data: Input data (DataFrame, dict, etc.)
-            **options: Visualization-specific options.
+            **options: Visualization-specific options, plus div_id.
 
         Returns:
             HTML string with embedded chart.
         """
-        pass
+        # "</" would terminate the embedding script block early if a
+        # label contained it; escaping keeps the JSON equivalent
+        chart_json = self.render_json(data, **options).replace("</", "<\\/")
+        return _HTML_TEMPLATE.format(
+            div_id=options.get("div_id", "chart"),
+            chart_json=chart_json,
+        )
@@ -1,14 +1,87 @@
 """Chart visualization implementations."""
 
-import json
+import hashlib
+from collections import defaultdict
 from typing import Any
 
+import networkx as nx
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
-from plotly.utils import PlotlyJSONEncoder
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+# Private module, but this is the encoder go.Figure serialization runs;
+# plain dicts never pass through it, so _maybe_binary calls it directly
+from _plotly_utils.utils import to_typed_array_spec
 
 from analytics.visualizations.base import Visualization
 
+# Hot dict-input paths skip graph_objects construction (per-property
+# schema validation) and serialize plain figure dicts directly. The
+# default template is resolved once so the output matches go.Figure.
+_DEFAULT_TEMPLATE = pio.templates[pio.templates.default or "plotly"].to_plotly_json()
+
+
+def _base_layout(options: dict, axes: bool = True) -> dict:
+    """Layout dict equivalent to the update_layout calls on the hot paths."""
+    layout: dict[str, Any] = {
+        "template": _DEFAULT_TEMPLATE,
+        "title": {"text": options.get("title", "")},
+    }
+    if axes:
+        layout["xaxis"] = {"title": {"text": options.get("x_label", "")}}
+        layout["yaxis"] = {"title": {"text": options.get("y_label", "")}}
+    return layout
+
+# Point count above which ScatterTimeline groups via pandas instead of
+# the per-point Python loop
+_VECTORIZE_MIN_POINTS = 1000
+
+_DEFAULT_POINT_COLOR = "rgba(31, 119, 180, 0.8)"
+
+# Length above which binary_encode=True converts numeric arrays for
+# base64 typed-array serialization
+_BINARY_ENCODE_MIN = 500
+
+
+def _maybe_binary(values: Any) -> Any:
+    """Return large numeric lists as base64 typed-array specs.
+
+    The {"dtype", "bdata"} spec is several times smaller on the wire
+    and faster for plotly.js to decode than a plain JSON number array,
+    but only go.Figure's serialization layer produces it; to_json_plotly
+    on a plain dict writes numpy arrays back out as number arrays. So
+    the spec is built here with the same encoder the figure path uses.
+    Non-numeric or small inputs pass through unchanged.
+    """
+    if isinstance(values, (list, tuple)) and len(values) > _BINARY_ENCODE_MIN:
+        arr = np.asarray(values)
+        if arr.dtype.kind in "if":
+            return to_typed_array_spec(arr)
+    return values
+
+
+# Constant BoxPlot trace styling, shared across every trace instead of
+# being rebuilt per group
+_BOX_BASE = {
+    "jitter": 0.3,
+    "pointpos": 0,
+    "boxmean": True,  # Show mean as dashed line
+    "marker": dict(
+        color="rgba(31, 119, 180, 0.7)",
+        outliercolor="rgba(31, 119, 180, 1)",
+        size=6,
+    ),
+    "line": dict(color="rgba(31, 119, 180, 1)"),
+    "fillcolor": "rgba(31, 119, 180, 0.3)",
+}
+
+# Spring layouts are the dominant cost of NetworkGraph renders
+# (O(N^2) per iteration), so positions are memoized by graph topology
+_LAYOUT_CACHE: dict[str, dict] = {}
+_LAYOUT_CACHE_MAX = 64
+
 
 class BarChart(Visualization):
     """Bar chart visualization."""
@@ -35,36 +108,27 @@ class BarChart(Visualization):
                 title=options.get("title", ""),
                 orientation=options.get("orientation", "v"),
             )
-        else:
-            # Dict
-            fig = go.Figure(
-                data=[
-                    go.Bar(
-                        x=data.get("x", []),
-                        y=data.get("y", []),
-                        orientation=options.get("orientation", "v"),
-                    )
-                ]
+            fig.update_layout(
+                xaxis_title=options.get("x_label", ""),
+                yaxis_title=options.get("y_label", ""),
             )
-            fig.update_layout(title=options.get("title", ""))
-
-        fig.update_layout(
-            xaxis_title=options.get("x_label", ""),
-            yaxis_title=options.get("y_label", ""),
-        )
-
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render bar chart to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+            return fig.to_json()
+
+        # Dict: emit the figure dict directly, skipping graph_objects
+        # validation on the hot path
+        x = data.get("x", [])
+        y = data.get("y", [])
+        if options.get("binary_encode"):
+            x, y = _maybe_binary(x), _maybe_binary(y)
+        return to_json_plotly({
+            "data": [{
+                "type": "bar",
+                "x": x,
+                "y": y,
+                "orientation": options.get("orientation", "v"),
+            }],
+            "layout": _base_layout(options),
+        })
 
 
 class LineChart(Visualization):
@@ -85,40 +149,41 @@ class LineChart(Visualization):
             x_col = options.get("x_col", data.columns[0])
             y_cols = options.get("y_cols", [data.columns[1]])
             fig = px.line(data, x=x_col, y=y_cols, title=options.get("title", ""))
+            fig.update_layout(
+                xaxis_title=options.get("x_label", ""),
+                yaxis_title=options.get("y_label", ""),
+            )
+            return fig.to_json()
+
+        # Dict: emit the figure dict directly, skipping graph_objects
+        # validation on the hot path
+        x = data.get("x", [])
+        y_series = data.get("y", [])
+        line_dashes = options.get("line_dashes", [])
+        binary = options.get("binary_encode", False)
+        if binary:
+            x = _maybe_binary(x)
+        traces = []
+        if y_series and isinstance(y_series[0], (list, tuple)):
+            for i, y in enumerate(y_series):
+                name = data.get("names", [f"Series {i+1}"])[i]
+                dash = line_dashes[i] if i < len(line_dashes) else "solid"
+                traces.append({
+                    "type": "scatter",
+                    "mode": "lines",
+                    "x": x,
+                    "y": _maybe_binary(y) if binary else y,
+                    "name": name,
+                    "line": {"dash": dash},
+                })
         else:
-            fig = go.Figure()
-            x = data.get("x", [])
-            y_series = data.get("y", [])
-            line_dashes = options.get("line_dashes", [])
-            if y_series and isinstance(y_series[0], (list, tuple)):
-                for i, y in enumerate(y_series):
-                    name = data.get("names", [f"Series {i+1}"])[i]
-                    dash = line_dashes[i] if i < len(line_dashes) else "solid"
-                    fig.add_trace(go.Scatter(
-                        x=x, y=y, mode="lines", name=name,
-                        line=dict(dash=dash)
-                    ))
-            else:
-                fig.add_trace(go.Scatter(x=x, y=y_series, mode="lines"))
-            fig.update_layout(title=options.get("title", ""))
-
-        fig.update_layout(
-            xaxis_title=options.get("x_label", ""),
-            yaxis_title=options.get("y_label", ""),
-        )
-
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render line chart to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+            traces.append({
+                "type": "scatter",
+                "mode": "lines",
+                "x": x,
+                "y": _maybe_binary(y_series) if binary else y_series,
+            })
+        return to_json_plotly({"data": traces, "layout": _base_layout(options)})
 
 
 class BoxPlot(Visualization):
@@ -137,50 +202,26 @@ class BoxPlot(Visualization):
         """
         fig = go.Figure()
         horizontal = options.get("horizontal", False)
+        boxpoints = "all" if options.get("showpoints", True) else "outliers"
+        value_axis = "x" if horizontal else "y"
 
         if "groups" in data:
             # Multiple box plots
             for name, values in data["groups"].items():
-                trace_kwargs = {
-                    "name": name,
-                    "boxpoints": "all" if options.get("showpoints", True) else "outliers",
-                    "jitter": 0.3,
-                    "pointpos": 0,
-                    "boxmean": True,  # Show mean as dashed line
-                    "marker": dict(
-                        color="rgba(31, 119, 180, 0.7)",
-                        outliercolor="rgba(31, 119, 180, 1)",
-                        size=6,
-                    ),
-                    "line": dict(color="rgba(31, 119, 180, 1)"),
-                    "fillcolor": "rgba(31, 119, 180, 0.3)",
-                }
-                if horizontal:
-                    trace_kwargs["x"] = values
-                else:
-                    trace_kwargs["y"] = values
-                fig.add_trace(go.Box(**trace_kwargs))
+                fig.add_trace(go.Box(
+                    **_BOX_BASE,
+                    name=name,
+                    boxpoints=boxpoints,
+                    **{value_axis: values},
+                ))
         else:
             # Single box plot
-            trace_kwargs = {
-                "name": data.get("name", ""),
-                "boxpoints": "all" if options.get("showpoints", True) else "outliers",
-                "jitter": 0.3,
-                "pointpos": 0,
-                "boxmean": True,  # Show mean as dashed line
-                "marker": dict(
-                    color="rgba(31, 119, 180, 0.7)",
-                    outliercolor="rgba(31, 119, 180, 1)",
-                    size=6,
-                ),
-                "line": dict(color="rgba(31, 119, 180, 1)"),
-                "fillcolor": "rgba(31, 119, 180, 0.3)",
-            }
-            if horizontal:
-                trace_kwargs["x"] = data.get("values", [])
-            else:
-                trace_kwargs["y"] = data.get("values", [])
-            fig.add_trace(go.Box(**trace_kwargs))
+            fig.add_trace(go.Box(
+                **_BOX_BASE,
+                name=data.get("name", ""),
+                boxpoints=boxpoints,
+                **{value_axis: data.get("values", [])},
+            ))
 
         layout_kwargs = {
             "title": options.get("title", ""),
@@ -196,18 +237,7 @@ class BoxPlot(Visualization):
 
         fig.update_layout(**layout_kwargs)
 
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render box plot to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+        return fig.to_json()
 
 
 class ScatterTimeline(Visualization):
@@ -217,77 +247,121 @@ class ScatterTimeline(Visualization):
     def viz_type(self) -> str:
         return "scatter_timeline"
 
+    @staticmethod
+    def _group_points_soa(cols: dict) -> dict:
+        """Group columnar point arrays by category without a Python loop."""
+        y = np.asarray(cols.get("y", []))
+
+        def column(name: str, default: Any) -> np.ndarray:
+            if name in cols:
+                return np.asarray(cols[name])
+            return np.full(y.size, default, dtype=object)
+
+        x = column("x", None)
+        text = column("label", "")
+        colors = column("color", _DEFAULT_POINT_COLOR)
+
+        grouped = {}
+        cats, inverse = np.unique(y, return_inverse=True)
+        for i, cat in enumerate(cats):
+            mask = inverse == i
+            grouped[cat] = {
+                "x": x[mask].tolist(),
+                "text": text[mask].tolist(),
+                "colors": colors[mask].tolist(),
+            }
+        return grouped
+
+    @staticmethod
+    def _group_points_vectorized(points: list[dict]) -> dict:
+        """Group points by category with a single pandas groupby."""
+        df = pd.DataFrame(points)
+        for col, default in (("y", ""), ("x", None), ("label", ""), ("color", _DEFAULT_POINT_COLOR)):
+            if col not in df.columns:
+                df[col] = default
+            elif col != "x":
+                df[col] = df[col].fillna(default)
+        return {
+            cat: {
+                "x": grp["x"].tolist(),
+                "text": grp["label"].tolist(),
+                "colors": grp["color"].tolist(),
+            }
+            for cat, grp in df.groupby("y", sort=False)
+        }
+
     def render_json(self, data: Any, **options) -> str:
         """Render scatter timeline to Plotly JSON.
 
         Args:
-            data: Dict with 'points' list of {x: date_str, y: category, label: str, color: str}.
+            data: Dict with 'points' list of {x: date_str, y: category, label: str, color: str},
+                  or 'points_cols' with the same fields as parallel arrays
+                  ({x: [...], y: [...], label: [...], color: [...]}).
             **options: title, x_label, height, x_range (tuple of min/max dates).
         """
-        fig = go.Figure()
-
         points = data.get("points", [])
+        points_cols = data.get("points_cols")
         categories = data.get("categories", [])
 
-        # Group points by category for consistent coloring
-        category_points = {}
-        for point in points:
-            cat = point.get("y", "")
-            if cat not in category_points:
-                category_points[cat] = {"x": [], "text": [], "colors": []}
-            category_points[cat]["x"].append(point.get("x"))
-            category_points[cat]["text"].append(point.get("label", ""))
-            category_points[cat]["colors"].append(point.get("color", "rgba(31, 119, 180, 0.8)"))
-
-        # Create a trace for each category
+        # Group points by category for consistent coloring. Columnar
+        # input groups entirely in numpy; large row-wise timelines
+        # group in pandas (C-backed) rather than per point.
+        if points_cols is not None:
+            category_points = self._group_points_soa(points_cols)
+        elif len(points) >= _VECTORIZE_MIN_POINTS:
+            category_points = self._group_points_vectorized(points)
+        else:
+            category_points = defaultdict(
+                lambda: {"x": [], "text": [], "colors": []}
+            )
+            for point in points:
+                group = category_points[point.get("y", "")]
+                group["x"].append(point.get("x"))
+                group["text"].append(point.get("label", ""))
+                group["colors"].append(point.get("color", _DEFAULT_POINT_COLOR))
+
+        # Create a trace for each category; plain dicts skip
+        # graph_objects validation on this hot path
+        traces = []
         for cat in categories:
             if cat in category_points:
-                fig.add_trace(go.Scatter(
-                    x=category_points[cat]["x"],
-                    y=[cat] * len(category_points[cat]["x"]),
-                    mode="markers",
-                    name=cat,
-                    text=category_points[cat]["text"],
-                    hovertemplate="%{text}<br>%{x}<extra></extra>",
-                    marker=dict(
-                        size=12,
-                        color=category_points[cat]["colors"],
-                        line=dict(width=1, color="white"),
-                    ),
-                ))
-
+                traces.append({
+                    "type": "scatter",
+                    "mode": "markers",
+                    "name": cat,
+                    "x": category_points[cat]["x"],
+                    "y": [cat] * len(category_points[cat]["x"]),
+                    "text": category_points[cat]["text"],
+                    "hovertemplate": "%{text}<br>%{x}<extra></extra>",
+                    "marker": {
+                        "size": 12,
+                        "color": category_points[cat]["colors"],
+                        "line": {"width": 1, "color": "white"},
+                    },
+                })
+
+        xaxis = {
+            "title": {"text": options.get("x_label", "Date")},
+            "type": "date",
+        }
         x_range = options.get("x_range")
-        layout_kwargs = {
-            "title": options.get("title", ""),
-            "xaxis": dict(
-                title=options.get("x_label", "Date"),
-                type="date",
-                range=x_range if x_range else None,
-            ),
-            "yaxis": dict(
-                title="",
-                categoryorder="array",
-                categoryarray=list(reversed(categories)),
-            ),
+        if x_range:
+            xaxis["range"] = x_range
+        layout = {
+            "template": _DEFAULT_TEMPLATE,
+            "title": {"text": options.get("title", "")},
+            "xaxis": xaxis,
+            "yaxis": {
+                "title": {"text": ""},
+                "categoryorder": "array",
+                "categoryarray": categories[::-1],
+            },
             "height": options.get("height", 300),
             "showlegend": False,
             "hovermode": "closest",
         }
 
-        fig.update_layout(**layout_kwargs)
-
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render scatter timeline to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+        return to_json_plotly({"data": traces, "layout": layout})
 
 
 class PieChart(Visualization):
@@ -304,26 +378,17 @@ class PieChart(Visualization):
             data: Dict with 'labels' and 'values' keys.
             **options: title.
         """
-        pie_kwargs = dict(
-            labels=data.get("labels", []),
-            values=data.get("values", []),
-        )
+        trace = {
+            "type": "pie",
+            "labels": data.get("labels", []),
+            "values": data.get("values", []),
+        }
         if data.get("colors"):
-            pie_kwargs["marker"] = dict(colors=data["colors"])
-        fig = go.Figure(data=[go.Pie(**pie_kwargs)])
-        fig.update_layout(title=options.get("title", ""))
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render pie chart to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+            trace["marker"] = {"colors": data["colors"]}
+        return to_json_plotly({
+            "data": [trace],
+            "layout": _base_layout(options, axes=False),
+        })
 
 
 class SankeyDiagram(Visualization):
@@ -347,44 +412,37 @@ class SankeyDiagram(Visualization):
         colors = data.get("colors", [])
         urls = data.get("urls", [])
 
-        fig = go.Figure(data=[go.Sankey(
-            node=dict(
-                pad=15,
-                thickness=20,
-                line=dict(color="black", width=0.5),
-                label=labels,
-                color=colors if colors else None,
-                customdata=urls if urls else None,
-            ),
-            link=dict(
-                source=sources,
-                target=targets,
-                value=values,
-                color="rgba(150, 150, 150, 0.4)",
-            )
-        )])
+        if options.get("binary_encode"):
+            sources = _maybe_binary(sources)
+            targets = _maybe_binary(targets)
+            values = _maybe_binary(values)
+
+        # Raw trace dict: go.Sankey validates every node/link element,
+        # which dominates render time for large diagrams
+        trace = {
+            "type": "sankey",
+            "node": {
+                "pad": 15,
+                "thickness": 20,
+                "line": {"color": "black", "width": 0.5},
+                "label": labels,
+                "color": colors if colors else None,
+                "customdata": urls if urls else None,
+            },
+            "link": {
+                "source": sources,
+                "target": targets,
+                "value": values,
+                "color": "rgba(150, 150, 150, 0.4)",
+            },
+        }
 
-        fig.update_layout(
-            title=dict(
-                text=options.get("title", ""),
-                font=dict(size=16),
-            ),
-            font=dict(size=12),
-            height=options.get("height", 500),
-        )
+        layout = _base_layout(options, axes=False)
+        layout["title"]["font"] = {"size": 16}
+        layout["font"] = {"size": 12}
+        layout["height"] = options.get("height", 500)
 
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render Sankey diagram to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+        return to_json_plotly({"data": [trace], "layout": layout})
 
 
 class NetworkGraph(Visualization):
@@ -402,8 +460,6 @@ class NetworkGraph(Visualization):
                   'edges' (list of {source, target}).
             **options: title.
         """
-        import networkx as nx
-
         G = nx.DiGraph()
 
         nodes = data.get("nodes", [])
@@ -415,15 +471,48 @@ class NetworkGraph(Visualization):
         for edge in edges:
             G.add_edge(edge["source"], edge["target"])
 
-        pos = nx.spring_layout(G)
+        # Seeded layout is deterministic for a given topology, so the
+        # positions can be reused across renders of the same graph
+        topo_key = hashlib.blake2b(
+            repr((sorted(G.nodes()), sorted(G.edges()))).encode(),
+            digest_size=16,
+        ).hexdigest()
+        pos = _LAYOUT_CACHE.get(topo_key)
+        if pos is None:
+            pos = nx.spring_layout(G, seed=42)
+            if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_MAX:
+                _LAYOUT_CACHE.pop(next(iter(_LAYOUT_CACHE)))
+            _LAYOUT_CACHE[topo_key] = pos
+
+        # Assemble coordinates as numpy arrays instead of per-node/edge
+        # Python appends; NaN plays the same line-break role as None
+        node_list = list(G.nodes())
+        pos_arr = (
+            np.array([pos[n] for n in node_list])
+            if node_list
+            else np.empty((0, 2))
+        )
 
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+        if G.number_of_edges():
+            index = {n: i for i, n in enumerate(node_list)}
+            endpoints = np.fromiter(
+                (index[n] for edge in G.edges() for n in edge), dtype=np.int32
+            ).reshape(-1, 2)
+            edge_x = np.empty(len(endpoints) * 3)
+            edge_x[0::3] = pos_arr[endpoints[:, 0], 0]
+            edge_x[1::3] = pos_arr[endpoints[:, 1], 0]
+            edge_x[2::3] = np.nan
+            edge_y = np.empty(len(endpoints) * 3)
+            edge_y[0::3] = pos_arr[endpoints[:, 0], 1]
+            edge_y[1::3] = pos_arr[endpoints[:, 1], 1]
+            edge_y[2::3] = np.nan
+            # Lists serialize the NaNs as null, plotly's documented
+            # line-break marker; a float array would base64-encode
+            # them into the typed-array payload instead
+            edge_x = edge_x.tolist()
+            edge_y = edge_y.tolist()
+        else:
+            edge_x = edge_y = []
 
         edge_trace = go.Scatter(
             x=edge_x,
@@ -433,14 +522,9 @@ class NetworkGraph(Visualization):
             mode="lines",
         )
 
-        node_x = []
-        node_y = []
-        node_text = []
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            node_text.append(G.nodes[node].get("label", node))
+        node_x = pos_arr[:, 0].tolist()
+        node_y = pos_arr[:, 1].tolist()
+        node_text = [G.nodes[n].get("label", n) for n in node_list]
 
         node_trace = go.Scatter(
             x=node_x,
@@ -467,15 +551,4 @@ class NetworkGraph(Visualization):
             ),
         )
 
-        return json.dumps(fig, cls=PlotlyJSONEncoder)
-
-    def render_html(self, data: Any, **options) -> str:
-        """Render network graph to HTML."""
-        chart_json = self.render_json(data, **options)
-        div_id = options.get("div_id", "chart")
-        return f"""
-        <div id="{div_id}"></div>
-        <script>
-            Plotly.newPlot('{div_id}', {chart_json}.data, {chart_json}.layout);
-        </script>
-        """
+        return fig.to_json()
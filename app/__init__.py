@@ -1,14 +1,19 @@
 """CaseLoad application factory."""
 
+import gzip
 import logging
 import os
 import sys
 
-from flask import Flask
+from flask import Flask, request
 
 from app.config import config
 from app.extensions import db
 
+# Logging setup is process-wide; remember it so repeated create_app
+# calls (tests, embedded servers) do not redo handler/level wiring
+_logging_configured = False
+
 
 def create_app(config_name: str | None = None) -> Flask:
     """Create and configure the Flask application.
@@ -34,22 +39,94 @@ def create_app(config_name: str | None = None) -> Flask:
 
     # Initialize extensions
     db.init_app(app)
+    _configure_engine(app)
 
     # Import models so they are registered with SQLAlchemy
     from app import models  # noqa: F401
 
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Create database tables (skipped in tests, which build the schema
+    # once per session)
+    if app.config.get("AUTO_CREATE_TABLES", True):
+        with app.app_context():
+            db.create_all()
 
     # Register blueprints
     _register_blueprints(app)
 
+    # Compress large responses for clients that accept gzip
+    _configure_compression(app)
+
     return app
 
 
+#: Mimetypes worth compressing; images and binaries are left alone.
+_COMPRESSIBLE_MIMETYPES = frozenset(
+    {"application/json", "text/html", "text/css", "application/javascript"}
+)
+_COMPRESS_MIN_SIZE = 1024
+
+
+def _configure_compression(app: Flask) -> None:
+    """Gzip responses over 1KB when the client accepts it.
+
+    Chart JSON and dashboard HTML dominate response sizes and
+    compress 5-10x; for remote clients transfer time outweighs the
+    encode cost.
+    """
+
+    @app.after_request
+    def _compress_response(response):
+        if (
+            response.direct_passthrough
+            or response.status_code < 200
+            or response.status_code >= 300
+            or response.mimetype not in _COMPRESSIBLE_MIMETYPES
+            or "Content-Encoding" in response.headers
+            or (response.content_length or 0) < _COMPRESS_MIN_SIZE
+            or "gzip" not in request.accept_encodings
+        ):
+            return response
+
+        compressed = gzip.compress(response.get_data(), compresslevel=6)
+        if len(compressed) >= response.content_length:
+            return response
+
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers.add("Vary", "Accept-Encoding")
+        return response
+
+
+def _configure_engine(app: Flask) -> None:
+    """Apply SQLite pragmas for better concurrent read behavior.
+
+    WAL lets readers proceed during writes (i.e. while a sync is
+    loading trackers) and NORMAL synchronous is safe with WAL for a
+    cache database that can be rebuilt from Jira.
+    """
+    from sqlalchemy import event
+
+    with app.app_context():
+        engine = db.engine
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 def _configure_logging(app: Flask) -> None:
-    """Configure application logging."""
+    """Configure application logging (once per process)."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     log_level = logging.DEBUG if app.debug else logging.INFO
 
     # Configure root logger for our modules
@@ -1,44 +1,113 @@
 """API blueprint - REST API for AJAX requests."""
 
-from flask import Blueprint, jsonify, request
+import json
+from datetime import date, datetime
 
+from flask import Blueprint, Response, current_app, request
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
+
+from analytics.registry import AnalyticsRegistry
 from app.extensions import db
+from app.models import CVE, Project, Team, Tracker
 
 bp = Blueprint("api", __name__)
 
 
+def _json_default(value):
+    """Encode datetimes as ISO 8601 during serialization."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_response(data, status: int = 200) -> Response:
+    """Serialize an API payload in one pass.
+
+    Skips jsonify's key sorting and pretty-printing and encodes
+    datetime columns directly, so endpoints can pass raw model values.
+    """
+    body = json.dumps(data, separators=(",", ":"), default=_json_default)
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _etag_for(*models) -> str:
+    """Weak ETag from max(updated_at) and row count of each model.
+
+    Cheap to recompute per request, and changes whenever a sync
+    touches any of the underlying tables.
+    """
+    parts = []
+    for model in models:
+        last, count = db.session.query(
+            func.max(model.updated_at), func.count(model.id)
+        ).one()
+        parts.append(f"{last.timestamp() if last else 0}-{count}")
+    return "-".join(parts)
+
+
 @bp.route("/teams")
 def list_teams():
     """List all teams."""
-    from app.models import Team
+    # Teams change only during sync; answer repeat polls with a 304
+    etag = _etag_for(Team, Project)
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304)
 
     teams = Team.query.all()
-    return jsonify(
+
+    # One grouped count instead of a projects.count() query per team
+    project_counts = dict(
+        db.session.query(Project.team_id, func.count(Project.id))
+        .group_by(Project.team_id)
+        .all()
+    )
+
+    response = json_response(
         [
             {
                 "id": t.id,
                 "name": t.name,
                 "description": t.description,
-                "project_count": t.projects.count(),
+                "project_count": project_counts.get(t.id, 0),
             }
             for t in teams
         ]
     )
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @bp.route("/projects")
 def list_projects():
     """List all projects."""
-    from app.models import Project
+    # Tracker counts feed the payload, so the tag covers trackers too
+    etag = _etag_for(Project, Team, Tracker)
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304)
 
     team_id = request.args.get("team_id", type=int)
 
-    query = Project.query
+    # Only the serialized columns, with the team row joined in rather
+    # than lazy-loaded per project
+    query = Project.query.options(
+        load_only(Project.id, Project.key, Project.name, Project.team_id),
+        joinedload(Project.team),
+    )
     if team_id:
         query = query.filter_by(team_id=team_id)
 
     projects = query.all()
-    return jsonify(
+
+    # One grouped count instead of a trackers.count() query per project
+    tracker_counts = dict(
+        db.session.query(Tracker.project_id, func.count(Tracker.id))
+        .filter(Tracker.project_id.in_([p.id for p in projects]))
+        .group_by(Tracker.project_id)
+        .all()
+    )
+
+    response = json_response(
         [
             {
                 "id": p.id,
@@ -46,23 +115,33 @@ def list_projects():
                 "name": p.name,
                 "team_id": p.team_id,
                 "team_name": p.team.name if p.team else None,
-                "tracker_count": p.trackers.count(),
+                "tracker_count": tracker_counts.get(p.id, 0),
             }
             for p in projects
         ]
     )
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @bp.route("/cves")
 def list_cves():
     """List CVEs with optional filters."""
-    from app.models import CVE
-
     severity = request.args.get("severity")
     embargoed = request.args.get("embargoed", type=bool)
     limit = request.args.get("limit", 50, type=int)
 
-    query = CVE.query
+    # Skip the wide url/description columns the list view never shows
+    query = CVE.query.options(
+        load_only(
+            CVE.id,
+            CVE.cve_id,
+            CVE.severity,
+            CVE.cvss_score,
+            CVE.is_embargoed,
+            CVE.published_date,
+        )
+    )
 
     if severity:
         query = query.filter_by(severity=severity)
@@ -70,8 +149,25 @@ def list_cves():
         query = query.filter_by(is_embargoed=embargoed)
 
     cves = query.order_by(CVE.created_at.desc()).limit(limit).all()
+    cve_ids = [c.id for c in cves]
+
+    # Two grouped queries replace a trackers.count() plus an
+    # affected_teams walk (one query per tracker) for every CVE row
+    tracker_counts = dict(
+        db.session.query(Tracker.cve_id, func.count(Tracker.id))
+        .filter(Tracker.cve_id.in_(cve_ids))
+        .group_by(Tracker.cve_id)
+        .all()
+    )
+    team_counts = dict(
+        db.session.query(Tracker.cve_id, func.count(func.distinct(Project.team_id)))
+        .join(Project, Tracker.project_id == Project.id)
+        .filter(Tracker.cve_id.in_(cve_ids), Project.team_id.isnot(None))
+        .group_by(Tracker.cve_id)
+        .all()
+    )
 
-    return jsonify(
+    return json_response(
         [
             {
                 "id": c.id,
@@ -79,9 +175,9 @@ def list_cves():
                 "severity": c.severity,
                 "cvss_score": c.cvss_score,
                 "is_embargoed": c.is_embargoed,
-                "published_date": c.published_date.isoformat() if c.published_date else None,
-                "tracker_count": c.trackers.count(),
-                "affected_teams": len(c.affected_teams),
+                "published_date": c.published_date,
+                "tracker_count": tracker_counts.get(c.id, 0),
+                "affected_teams": team_counts.get(c.id, 0),
             }
             for c in cves
         ]
@@ -91,14 +187,24 @@ def list_cves():
 @bp.route("/cves/<cve_id>")
 def get_cve(cve_id: str):
     """Get details for a specific CVE."""
-    from app.models import CVE
-
-    cve = CVE.query.filter_by(cve_id=cve_id).first()
+    # Eager-load trackers with their project and team so the response
+    # loop below issues no per-tracker queries
+    options = [
+        selectinload(CVE.trackers)
+        .joinedload(Tracker.project)
+        .joinedload(Project.team)
+    ]
+    if current_app.debug or current_app.testing:
+        # Make any lazy load this view reintroduces raise instead of
+        # silently regressing to N+1
+        options.append(raiseload("*"))
+
+    cve = CVE.query.options(*options).filter_by(cve_id=cve_id).first()
     if not cve:
-        return jsonify({"error": "CVE not found"}), 404
+        return json_response({"error": "CVE not found"}, status=404)
 
     trackers = list(cve.trackers)
-    return jsonify(
+    return json_response(
         {
             "id": cve.id,
             "cve_id": cve.cve_id,
@@ -107,12 +213,8 @@ def get_cve(cve_id: str):
             "severity": cve.severity,
             "cvss_score": cve.cvss_score,
             "is_embargoed": cve.is_embargoed,
-            "embargo_end_date": (
-                cve.embargo_end_date.isoformat() if cve.embargo_end_date else None
-            ),
-            "published_date": (
-                cve.published_date.isoformat() if cve.published_date else None
-            ),
+            "embargo_end_date": cve.embargo_end_date,
+            "published_date": cve.published_date,
             "trackers": [
                 {
                     "jira_key": t.jira_key,
@@ -136,8 +238,6 @@ def get_cve(cve_id: str):
 @bp.route("/projects/<project_key>/components")
 def list_components(project_key: str):
     """Return HTML option elements for downstream components in a project."""
-    from app.models import Project, Tracker
-
     project = Project.query.filter_by(key=project_key).first()
     if not project:
         return '<option value="">No components found</option>'
@@ -164,64 +264,109 @@ def list_components(project_key: str):
     return html
 
 
-@bp.route("/trackers")
-def list_trackers():
-    """List trackers with optional filters."""
-    from app.models import Tracker
+def _tracker_stmt():
+    """Build the filtered tracker listing statement from query params.
+
+    Read-only listing: selects just the serialized columns with the
+    project key and CVE key joined in, skipping ORM row hydration.
+    """
+    stmt = (
+        select(
+            Tracker.id,
+            Tracker.jira_key,
+            Tracker.summary,
+            Tracker.status,
+            Tracker.priority,
+            Tracker.assignee,
+            Tracker.created_date,
+            Tracker.resolved_date,
+            Tracker.days_open.label("days_open"),
+            Project.key.label("project_key"),
+            CVE.cve_id.label("cve_key"),
+        )
+        .select_from(Tracker)
+        .outerjoin(Project, Tracker.project_id == Project.id)
+        .outerjoin(CVE, Tracker.cve_id == CVE.id)
+    )
 
     project_id = request.args.get("project_id", type=int)
     cve_id = request.args.get("cve_id", type=int)
     status = request.args.get("status")
     open_only = request.args.get("open_only", type=bool)
-    limit = request.args.get("limit", 100, type=int)
-
-    query = Tracker.query
 
     if project_id:
-        query = query.filter_by(project_id=project_id)
+        stmt = stmt.where(Tracker.project_id == project_id)
     if cve_id:
-        query = query.filter_by(cve_id=cve_id)
+        stmt = stmt.where(Tracker.cve_id == cve_id)
     if status:
-        query = query.filter_by(status=status)
+        stmt = stmt.where(Tracker.status == status)
     if open_only:
-        query = query.filter(Tracker.resolved_date.is_(None))
+        stmt = stmt.where(Tracker.resolved_date.is_(None))
 
-    trackers = query.order_by(Tracker.created_date.desc()).limit(limit).all()
+    return stmt.order_by(Tracker.created_date.desc())
+
+
+def _tracker_row(r) -> dict:
+    """Serialize one tracker listing row."""
+    return {
+        "id": r.id,
+        "jira_key": r.jira_key,
+        "summary": r.summary,
+        "status": r.status,
+        "priority": r.priority,
+        "assignee": r.assignee,
+        "created_date": r.created_date,
+        "resolved_date": r.resolved_date,
+        "days_open": r.days_open,
+        "project_key": r.project_key,
+        "cve_id": r.cve_key,
+    }
 
-    return jsonify(
-        [
-            {
-                "id": t.id,
-                "jira_key": t.jira_key,
-                "summary": t.summary,
-                "status": t.status,
-                "priority": t.priority,
-                "assignee": t.assignee,
-                "created_date": (
-                    t.created_date.isoformat() if t.created_date else None
-                ),
-                "resolved_date": (
-                    t.resolved_date.isoformat() if t.resolved_date else None
-                ),
-                "days_open": t.days_open,
-                "project_key": t.project.key if t.project else None,
-                "cve_id": t.cve.cve_id if t.cve else None,
-            }
-            for t in trackers
-        ]
-    )
+
+@bp.route("/trackers")
+def list_trackers():
+    """List trackers with optional filters."""
+    limit = request.args.get("limit", 100, type=int)
+
+    rows = db.session.execute(_tracker_stmt().limit(limit)).all()
+
+    return json_response([_tracker_row(r) for r in rows])
+
+
+@bp.route("/trackers.ndjson")
+def stream_trackers():
+    """Stream trackers as NDJSON, one object per line.
+
+    Unlike /trackers this applies no default limit; rows are fetched
+    in server-side batches and written out as they arrive, so memory
+    stays bounded for arbitrarily large result sets.
+    """
+    from flask import stream_with_context
+
+    limit = request.args.get("limit", type=int)
+    stmt = _tracker_stmt().execution_options(yield_per=500)
+    if limit:
+        stmt = stmt.limit(limit)
+    result = db.session.execute(stmt)
+
+    @stream_with_context
+    def generate():
+        for r in result:
+            yield json.dumps(
+                _tracker_row(r), separators=(",", ":"), default=_json_default
+            ) + "\n"
+
+    return Response(generate(), mimetype="application/x-ndjson")
 
 
 @bp.route("/metrics/<metric_id>")
 def compute_metric(metric_id: str):
     """Compute and return a metric result as JSON."""
-    from analytics.registry import AnalyticsRegistry
-
     AnalyticsRegistry.discover()
     metric_class = AnalyticsRegistry.get(metric_id)
 
     if not metric_class:
-        return jsonify({"error": "Metric not found"}), 404
+        return json_response({"error": "Metric not found"}, status=404)
 
     metric_instance = metric_class()
 
@@ -233,11 +378,11 @@ def compute_metric(metric_id: str):
 
     result = metric_instance.compute(**filters)
 
-    return jsonify(
+    return json_response(
         {
             "metric_id": result.metric_id,
             "title": result.title,
-            "computed_at": result.computed_at.isoformat(),
+            "computed_at": result.computed_at,
             "summary": result.summary,
             "chart_json": result.chart_json,
             "error": result.error,
@@ -1,6 +1,12 @@
 """Impact blueprint - Vulnerability Impact (per-CVE blast radius)."""
 
-from flask import Blueprint, render_template, request
+from flask import Blueprint, current_app, redirect, render_template, request, url_for
+from sqlalchemy import func
+from sqlalchemy.orm import raiseload, selectinload
+
+from analytics.registry import AnalyticsRegistry
+from app.extensions import db
+from app.models import CVE, Project, Tracker
 
 bp = Blueprint("impact", __name__)
 
@@ -8,45 +14,50 @@ bp = Blueprint("impact", __name__)
 @bp.route("/")
 def index():
     """Vulnerability Impact dashboard."""
-    from sqlalchemy import func
-
-    from app.extensions import db
-    from app.models import CVE, Tracker
-
     page = request.args.get("page", 1, type=int)
     per_page = 20
 
-    # Get CVEs sorted by most recent tracker created_date (descending)
-    # Subquery to get max created_date per CVE
-    max_created_subq = (
-        db.session.query(
-            Tracker.cve_id,
-            func.max(Tracker.created_date).label("max_created")
-        )
-        .group_by(Tracker.cve_id)
-        .subquery()
-    )
+    # CVEs sorted by most recent tracker created_date (descending).
+    # One grouped aggregate replaces the old subquery join, and the
+    # trackers the table iterates are selectinloaded so the template
+    # issues no per-row queries.
+    options = [selectinload(CVE.trackers)]
+    if current_app.debug or current_app.testing:
+        # Catch template changes that would lazy-load per row
+        options.append(raiseload("*"))
 
-    # Join CVEs with the subquery and order by max created_date
     pagination = (
-        db.session.query(CVE)
-        .join(max_created_subq, CVE.id == max_created_subq.c.cve_id)
-        .order_by(max_created_subq.c.max_created.desc())
+        CVE.query.options(*options)
+        .join(Tracker, Tracker.cve_id == CVE.id)
+        .group_by(CVE.id)
+        .order_by(func.max(Tracker.created_date).desc())
         .paginate(page=page, per_page=per_page, error_out=False)
     )
 
+    # Batch the affected-team counts for the page; cve.affected_teams
+    # would run a join query per row
+    team_counts = dict(
+        db.session.query(Tracker.cve_id, func.count(func.distinct(Project.team_id)))
+        .join(Project, Tracker.project_id == Project.id)
+        .filter(
+            Tracker.cve_id.in_([c.id for c in pagination.items]),
+            Project.team_id.isnot(None),
+        )
+        .group_by(Tracker.cve_id)
+        .all()
+    )
+
     return render_template(
         "impact/index.html",
         recent_cves=pagination.items,
         pagination=pagination,
+        team_counts=team_counts,
     )
 
 
 @bp.route("/cve/<cve_id>")
 def cve_detail(cve_id: str):
     """Display blast radius for a specific CVE."""
-    from analytics.registry import AnalyticsRegistry
-
     AnalyticsRegistry.discover()
     metric_class = AnalyticsRegistry.get("blast_radius")
 
@@ -71,13 +82,9 @@ def search():
     if not cve_id:
         return render_template("impact/index.html", error="Please enter a CVE ID")
 
-    from app.models import CVE
-
     cve = CVE.query.filter_by(cve_id=cve_id).first()
 
     if cve:
-        from flask import redirect, url_for
-
         return redirect(url_for("impact.cve_detail", cve_id=cve_id))
 
     return render_template(
@@ -1,24 +1,46 @@
 """Main blueprint - home dashboard."""
 
+import time
+from datetime import datetime
+
 from flask import Blueprint, render_template, request, redirect, url_for, flash, current_app
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models import CVE, Project, Team, Tracker, Util
 
 bp = Blueprint("main", __name__)
 
+# Dashboard counts only change during sync; cache them briefly so
+# repeat home-page hits skip the five COUNT queries. Sync resets this.
+_STATS_CACHE: tuple[float, dict] | None = None
+_STATS_TTL = 60
+
 
 @bp.route("/")
 def index():
     """Home dashboard."""
-    from app.models import Team, Project, CVE, Tracker
-
-    stats = {
-        "teams": Team.query.count(),
-        "projects": Project.query.count(),
-        "cves": CVE.query.count(),
-        "trackers": Tracker.query.count(),
-        "open_trackers": Tracker.query.filter(
-            Tracker.resolved_date.is_(None)
-        ).count(),
-    }
+    global _STATS_CACHE
+
+    now = time.monotonic()
+    if _STATS_CACHE is not None and now - _STATS_CACHE[0] < _STATS_TTL:
+        stats = _STATS_CACHE[1]
+    else:
+        # All five counts as scalar subqueries in one round trip
+        row = db.session.execute(
+            select(
+                select(func.count(Team.id)).scalar_subquery().label("teams"),
+                select(func.count(Project.id)).scalar_subquery().label("projects"),
+                select(func.count(CVE.id)).scalar_subquery().label("cves"),
+                select(func.count(Tracker.id)).scalar_subquery().label("trackers"),
+                select(func.count(Tracker.id))
+                .where(Tracker.resolved_date.is_(None))
+                .scalar_subquery()
+                .label("open_trackers"),
+            )
+        ).one()
+        stats = dict(row._mapping)
+        _STATS_CACHE = (now, stats)
 
     # Check if Jira is configured
     jira_configured = bool(
@@ -32,10 +54,15 @@ def index():
 @bp.route("/sync", methods=["POST"])
 def sync():
     """Trigger data synchronization."""
+    global _STATS_CACHE
+
     from data.config_loader import sync_teams_from_config, load_teams_config
     from data.sources.jira_source import JiraDataSource
     from data.sync import SyncService
 
+    # Sync changes the dashboard counts; drop the cached stats
+    _STATS_CACHE = None
+
     # First sync teams/projects from config
     config_stats = sync_teams_from_config()
     flash(
@@ -60,12 +87,10 @@ def sync():
 
     if jira_server and jira_token:
         try:
-            from datetime import datetime
-            from app.models import Util
-
             jira = JiraDataSource(
                 server=jira_server,
                 api_token=jira_token,
+                saved_filter_id=current_app.config.get("JIRA_SAVED_FILTER_ID") or None,
             )
 
             success, message = jira.test_connection()
@@ -88,6 +113,7 @@ def sync():
 
             # Update last sync datetime on success
             Util.set_last_sync(sync_start_time)
+            Util.flush()
 
             flash(
                 f"Jira sync: {stats['trackers_created']} trackers created, "
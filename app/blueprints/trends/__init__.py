@@ -3,8 +3,11 @@
 from urllib.parse import quote
 
 from flask import Blueprint, current_app, render_template, request
+from sqlalchemy import func
 
-from analytics.visualizations.charts import PieChart, ScatterTimeline
+from analytics.registry import AnalyticsRegistry
+from app.extensions import db
+from app.models import CVE, Project, Tracker
 
 bp = Blueprint("trends", __name__)
 
@@ -12,29 +15,17 @@ bp = Blueprint("trends", __name__)
 @bp.route("/")
 def index():
     """Vulnerability Trends dashboard."""
-    from analytics.registry import AnalyticsRegistry
-
     AnalyticsRegistry.discover()
-    metrics = AnalyticsRegistry.get_by_category("trends")
 
     return render_template(
         "trends/index.html",
-        metrics=[
-            {
-                "id": m.metric_id.fget(None),
-                "title": m.title.fget(None),
-                "description": m.description.fget(None),
-            }
-            for m in metrics
-        ],
+        metrics=AnalyticsRegistry.get_metadata_by_category("trends"),
     )
 
 
 @bp.route("/metric/<metric_id>")
 def metric(metric_id: str):
     """Display a specific trends metric."""
-    from analytics.registry import AnalyticsRegistry
-
     AnalyticsRegistry.discover()
     metric_class = AnalyticsRegistry.get(metric_id)
 
@@ -62,8 +53,8 @@ def metric(metric_id: str):
 @bp.route("/component-history")
 def component_history():
     """Component CVE History page."""
-    from app.extensions import db
-    from app.models import Project, Tracker
+    # Deferred: pulls in plotly, which non-chart routes never need
+    from analytics.visualizations.charts import PieChart, ScatterTimeline
 
     projects = Project.query.order_by(Project.key).all()
 
@@ -99,31 +90,36 @@ def component_history():
     if selected_project and selected_component:
         project = Project.query.filter_by(key=selected_project).first()
         if project:
-            trackers = (
-                Tracker.query.filter(
-                    Tracker.project_id == project.id,
-                    Tracker.downstream_component == selected_component,
-                    Tracker.cve_id.isnot(None),
-                )
-                .order_by(Tracker.created_date)
-                .all()
+            # Shared filter for this project/component's CVE trackers
+            component_filter = (
+                Tracker.project_id == project.id,
+                Tracker.downstream_component == selected_component,
+                Tracker.cve_id.isnot(None),
             )
-            tracker_count = len(trackers)
 
-            # Collect unique CVE IDs across all trackers
-            seen = set()
-            for t in trackers:
-                if t.cve and t.cve.cve_id and t.cve.cve_id not in seen:
-                    seen.add(t.cve.cve_id)
-                    cve_ids.append(t.cve.cve_id)
-            cve_ids.sort()
+            # Status breakdown counted in SQL; the old version loaded
+            # every tracker row just to tally statuses in Python
+            status_counts = {
+                (status or "Unknown"): count
+                for status, count in db.session.query(Tracker.status, func.count())
+                .filter(*component_filter)
+                .group_by(Tracker.status)
+                .all()
+            }
+            tracker_count = sum(status_counts.values())
+
+            # Unique CVE IDs across all trackers; a single DISTINCT
+            # join instead of lazy-loading t.cve per tracker
+            cve_ids = sorted(
+                row[0]
+                for row in db.session.query(CVE.cve_id)
+                .join(Tracker, Tracker.cve_id == CVE.id)
+                .filter(*component_filter)
+                .distinct()
+            )
 
             # Build status breakdown pie chart
-            if trackers:
-                status_counts: dict[str, int] = {}
-                for t in trackers:
-                    status = t.status or "Unknown"
-                    status_counts[status] = status_counts.get(status, 0) + 1
+            if tracker_count:
                 sorted_statuses = sorted(status_counts.items(), key=lambda x: x[1], reverse=True)
                 pie = PieChart()
                 status_chart_json = pie.render_json(
@@ -134,12 +130,20 @@ def component_history():
                     title="Status Breakdown",
                 )
 
-                # Build resolution breakdown pie chart for closed trackers
-                resolution_counts: dict[str, int] = {}
-                for t in trackers:
-                    if not t.is_open:
-                        resolution = t.resolution or "Unknown"
-                        resolution_counts[resolution] = resolution_counts.get(resolution, 0) + 1
+                # Resolution breakdown for closed trackers, also
+                # grouped in SQL (closed = status in CLOSED_STATUSES)
+                resolution_counts = {
+                    (resolution or "Unknown"): count
+                    for resolution, count in db.session.query(
+                        Tracker.resolution, func.count()
+                    )
+                    .filter(
+                        *component_filter,
+                        func.lower(Tracker.status).in_(Tracker.CLOSED_STATUSES),
+                    )
+                    .group_by(Tracker.resolution)
+                    .all()
+                }
                 if resolution_counts:
                     resolution_colors = {
                         "Not a Bug": "#EF553B",
@@ -168,18 +172,25 @@ def component_history():
                 )
                 jira_url = f"{jira_server}/issues/?jql={quote(jql)}"
 
-            # Build ScatterTimeline chart
-            if trackers:
+            # Build ScatterTimeline chart from the two columns it
+            # needs rather than hydrating full Tracker objects
+            if tracker_count:
                 points = []
-                for t in trackers:
-                    if t.created_date:
-                        points.append(
-                            {
-                                "x": t.created_date.strftime("%Y-%m-%d"),
-                                "y": selected_component,
-                                "label": f"{t.jira_key} ({t.created_date.strftime('%Y-%m-%d')})",
-                            }
-                        )
+                timeline_rows = (
+                    db.session.query(Tracker.jira_key, Tracker.created_date)
+                    .filter(*component_filter, Tracker.created_date.isnot(None))
+                    .order_by(Tracker.created_date)
+                    .all()
+                )
+                for jira_key, created_date in timeline_rows:
+                    day = created_date.strftime("%Y-%m-%d")
+                    points.append(
+                        {
+                            "x": day,
+                            "y": selected_component,
+                            "label": f"{jira_key} ({day})",
+                        }
+                    )
 
                 chart_data = {
                     "points": points,
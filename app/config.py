@@ -16,9 +16,25 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Pool hygiene: pre-ping drops stale pooled connections and
+    # recycle caps their age, which matters when DATABASE_URL points
+    # at a network database. Both are no-ops worth keeping on SQLite.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+    # Create missing tables during create_app. Tests disable this and
+    # manage the schema once per session instead.
+    AUTO_CREATE_TABLES = True
+
     # Jira settings
     JIRA_SERVER = os.environ.get("JIRA_SERVER", "")
     JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN", "")
+    # Optional saved filter replacing the labels predicate in sync JQL;
+    # the server memoizes filter results, which is much cheaper than
+    # re-evaluating a labels-IN scan on every page
+    JIRA_SAVED_FILTER_ID = os.environ.get("JIRA_SAVED_FILTER_ID", "")
 
 
 class DevelopmentConfig(Config):
@@ -38,6 +54,7 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    AUTO_CREATE_TABLES = False
 
 
 config = {
@@ -23,7 +23,7 @@ class CVE(db.Model):
     )
 
     # Relationships
-    trackers = db.relationship("Tracker", back_populates="cve", lazy="dynamic")
+    trackers = db.relationship("Tracker", back_populates="cve")
 
     def __repr__(self) -> str:
         return f"<CVE {self.cve_id}>"
@@ -31,17 +31,29 @@ class CVE(db.Model):
     @property
     def affected_teams(self) -> list:
         """Get list of teams affected by this CVE."""
-        teams = set()
-        for tracker in self.trackers:
-            if tracker.project and tracker.project.team:
-                teams.add(tracker.project.team)
-        return list(teams)
+        # Single join query; iterating self.trackers lazy-loaded
+        # project and team once per tracker
+        from app.models.project import Project
+        from app.models.team import Team
+        from app.models.tracker import Tracker
+
+        return (
+            Team.query.join(Project, Project.team_id == Team.id)
+            .join(Tracker, Tracker.project_id == Project.id)
+            .filter(Tracker.cve_id == self.id)
+            .distinct()
+            .all()
+        )
 
     @property
     def affected_projects(self) -> list:
         """Get list of projects affected by this CVE."""
-        projects = set()
-        for tracker in self.trackers:
-            if tracker.project:
-                projects.add(tracker.project)
-        return list(projects)
+        from app.models.project import Project
+        from app.models.tracker import Tracker
+
+        return (
+            Project.query.join(Tracker, Tracker.project_id == Project.id)
+            .filter(Tracker.cve_id == self.id)
+            .distinct()
+            .all()
+        )
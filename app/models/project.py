@@ -31,7 +31,7 @@ class Project(db.Model):
 
     # Relationships
     team = db.relationship("Team", back_populates="projects")
-    trackers = db.relationship("Tracker", back_populates="project", lazy="dynamic")
+    trackers = db.relationship("Tracker", back_populates="project")
 
     # Project dependencies (fix ordering)
     # upstream_dependencies: projects that must deliver before this one
@@ -17,7 +17,7 @@ class Team(db.Model):
     )
 
     # Relationships
-    projects = db.relationship("Project", back_populates="team", lazy="dynamic")
+    projects = db.relationship("Project", back_populates="team")
 
     def __repr__(self) -> str:
         return f"<Team {self.name}>"
@@ -1,5 +1,11 @@
 """Tracker model."""
 
+from datetime import datetime
+
+from sqlalchemy import case, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import validates
+
 from app.extensions import db
 
 
@@ -8,13 +14,16 @@ class Tracker(db.Model):
 
     __tablename__ = "trackers"
 
+    # Statuses that mean the tracker is no longer open (compared lowercased)
+    CLOSED_STATUSES = frozenset({"done", "closed", "resolved", "cancelled"})
+
     id = db.Column(db.Integer, primary_key=True)
     jira_key = db.Column(db.String(50), unique=True, nullable=False, index=True)
     summary = db.Column(db.String(512), nullable=True)
     status = db.Column(db.String(50), nullable=True)
     resolution = db.Column(db.String(50), nullable=True)
     priority = db.Column(db.String(50), nullable=True)
-    severity = db.Column(db.String(50), nullable=True)  # Critical, Important, Moderate
+    severity = db.Column(db.String(50), nullable=True)  # critical/important/moderate/low, stored lowercased
     assignee = db.Column(db.String(255), nullable=True)
     reporter = db.Column(db.String(255), nullable=True)
     created_date = db.Column(db.DateTime, nullable=True)
@@ -23,6 +32,15 @@ class Tracker(db.Model):
     due_date = db.Column(db.DateTime, nullable=True)
     sla_date = db.Column(db.DateTime, nullable=True)  # SLA target date from Jira
     sla_breach = db.Column(db.Boolean, default=False, nullable=False)
+    # Days from creation to resolution, computed by the database so
+    # analytics can filter/aggregate on it without per-row arithmetic
+    resolution_days = db.Column(
+        db.Integer,
+        db.Computed(
+            "CAST(julianday(resolved_date) - julianday(created_date) AS INTEGER)"
+        ),
+        nullable=True,
+    )
     closure_reason = db.Column(db.String(100), nullable=True)
     downstream_component = db.Column(db.String(255), nullable=True)
 
@@ -41,21 +59,59 @@ class Tracker(db.Model):
     project = db.relationship("Project", back_populates="trackers")
     cve = db.relationship("CVE", back_populates="trackers")
 
+    __table_args__ = (
+        # Covers the analytics date-window scans (SLA compliance, tracker
+        # volume) that filter on resolved/created dates and group by project
+        db.Index(
+            "ix_trackers_resolved_created_project",
+            "resolved_date",
+            "created_date",
+            "project_id",
+        ),
+        db.Index("ix_trackers_resolution_days", "resolution_days"),
+        # Covers all component-history queries, which filter on
+        # project + downstream_component + cve_id IS NOT NULL, and the
+        # DISTINCT component listing for a project
+        db.Index(
+            "ix_trackers_project_component_cve",
+            "project_id",
+            "downstream_component",
+            "cve_id",
+        ),
+        # Covers the impact dashboard's max(created_date) per CVE
+        db.Index("ix_trackers_cve_created", "cve_id", "created_date"),
+    )
+
     def __repr__(self) -> str:
         return f"<Tracker {self.jira_key}>"
 
+    @validates("severity")
+    def _normalize_severity(self, key: str, value: str | None) -> str | None:
+        """Lowercase severity at write time so queries compare it directly."""
+        return value.lower() if value else value
+
     @property
     def is_open(self) -> bool:
         """Check if tracker is still open."""
-        closed_statuses = {"done", "closed", "resolved", "cancelled"}
-        return self.status.lower() not in closed_statuses if self.status else True
+        return self.status.lower() not in self.CLOSED_STATUSES if self.status else True
 
-    @property
+    @hybrid_property
     def days_open(self) -> int | None:
         """Calculate days the tracker has been open."""
         if not self.created_date:
             return None
-        from datetime import datetime
+        if self.resolved_date:
+            return self.resolution_days
+        return (datetime.utcnow() - self.created_date).days
 
-        end_date = self.resolved_date or datetime.utcnow()
-        return (end_date - self.created_date).days
+    @days_open.expression
+    def days_open(cls):
+        """SQL form so queries can select, filter and sort on it."""
+        return case(
+            (cls.created_date.is_(None), None),
+            (cls.resolved_date.isnot(None), cls.resolution_days),
+            else_=cast(
+                func.julianday("now") - func.julianday(cls.created_date),
+                db.Integer,
+            ),
+        )
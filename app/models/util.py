@@ -3,6 +3,12 @@
 from datetime import datetime
 from app.extensions import db
 
+# Values read or written this process, so repeated gets of sync-state
+# constants cost no round trip. Writes land here and in _dirty_keys
+# until flush() upserts them in one statement.
+_util_cache: dict[str, str | None] = {}
+_dirty_keys: set[str] = set()
+
 
 class Util(db.Model):
     """Key-value store for application state like sync timestamps."""
@@ -21,19 +27,37 @@ class Util(db.Model):
     @classmethod
     def get(cls, key: str, default: str | None = None) -> str | None:
         """Get a value by key."""
+        if key in _util_cache:
+            value = _util_cache[key]
+            return value if value is not None else default
         record = cls.query.filter_by(key=key).first()
+        _util_cache[key] = record.value if record else None
         return record.value if record else default
 
     @classmethod
     def set(cls, key: str, value: str) -> None:
-        """Set a value by key."""
-        record = cls.query.filter_by(key=key).first()
-        if record:
-            record.value = value
-        else:
-            record = cls(key=key, value=value)
-            db.session.add(record)
+        """Set a value by key. Buffered until flush()."""
+        _util_cache[key] = value
+        _dirty_keys.add(key)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write all buffered set() calls in one upsert and commit."""
+        if not _dirty_keys:
+            return
+
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        stmt = sqlite_insert(cls.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": stmt.excluded.value, "updated_at": db.func.now()},
+        )
+        db.session.execute(
+            stmt, [{"key": key, "value": _util_cache[key]} for key in _dirty_keys]
+        )
         db.session.commit()
+        _dirty_keys.clear()
 
     @classmethod
     def get_last_sync(cls) -> datetime | None:
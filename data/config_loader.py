@@ -3,10 +3,22 @@
 import json
 from pathlib import Path
 
+try:  # optional: ~3x faster JSON decoding, parses bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed configs keyed by (path, mtime_ns); an edited file gets a new
+# mtime and therefore a fresh parse, so no manual invalidation needed
+_CONFIG_CACHE: dict[tuple[str, int], dict] = {}
+
 
 def load_teams_config(config_path: str | Path | None = None) -> dict:
     """Load teams and projects configuration from JSON file.
 
+    The parsed result is cached by file mtime, so repeated calls skip
+    disk I/O and JSON decoding until the file changes.
+
     Args:
         config_path: Path to the JSON config file. Defaults to config/teams.json.
 
@@ -21,8 +33,17 @@ def load_teams_config(config_path: str | Path | None = None) -> dict:
     if not config_path.exists():
         return {"teams": [], "project_dependencies": {}}
 
-    with open(config_path) as f:
-        return json.load(f)
+    key = (str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        if orjson is not None:
+            cached = orjson.loads(config_path.read_bytes())
+        else:
+            with open(config_path) as f:
+                cached = json.load(f)
+        _CONFIG_CACHE.clear()  # keep at most one parse per process
+        _CONFIG_CACHE[key] = cached
+    return cached
 
 
 def sync_teams_from_config(config_path: str | Path | None = None) -> dict:
@@ -34,43 +55,86 @@ def sync_teams_from_config(config_path: str | Path | None = None) -> dict:
     Returns:
         Statistics about the sync operation.
     """
+    from sqlalchemy import insert
+
     from app.extensions import db
     from app.models import Team, Project
 
     config = load_teams_config(config_path)
     stats = {"teams_created": 0, "teams_updated": 0, "projects_created": 0}
 
-    # Create/update teams and their projects
-    for team_data in config.get("teams", []):
-        team = Team.query.filter_by(name=team_data["name"]).first()
+    teams_config = config.get("teams", [])
+    dependencies = config.get("project_dependencies", {})
+
+    # Prefetch everything the config references with one IN query per
+    # table instead of a filter_by query per team/project in the loops
+    team_names = [t["name"] for t in teams_config]
+    project_keys = {k for t in teams_config for k in t.get("projects", [])}
+    project_keys.update(dependencies)
+    project_keys.update(k for keys in dependencies.values() for k in keys)
+
+    existing_teams = {
+        t.name: t for t in Team.query.filter(Team.name.in_(team_names)).all()
+    }
+    existing_projects = {
+        p.key: p for p in Project.query.filter(Project.key.in_(project_keys)).all()
+    }
+
+    # Create/update teams, then bulk-insert the new ones
+    new_teams = []
+    for team_data in teams_config:
+        team = existing_teams.get(team_data["name"])
         if not team:
-            team = Team(name=team_data["name"], description=team_data.get("description"))
-            db.session.add(team)
+            new_teams.append(
+                {"name": team_data["name"], "description": team_data.get("description")}
+            )
             stats["teams_created"] += 1
         else:
             team.description = team_data.get("description")
             stats["teams_updated"] += 1
 
-        db.session.flush()
-
-        # Create projects for this team
+    if new_teams:
+        db.session.execute(insert(Team.__table__), new_teams)
+        existing_teams.update(
+            {
+                t.name: t
+                for t in Team.query.filter(
+                    Team.name.in_([t["name"] for t in new_teams])
+                ).all()
+            }
+        )
+
+    # Assign projects to their teams, bulk-inserting missing ones
+    new_projects = []
+    for team_data in teams_config:
+        team_id = existing_teams[team_data["name"]].id
         for project_key in team_data.get("projects", []):
-            project = Project.query.filter_by(key=project_key).first()
+            project = existing_projects.get(project_key)
             if not project:
-                project = Project(key=project_key, name=project_key, team_id=team.id)
-                db.session.add(project)
+                new_projects.append(
+                    {"key": project_key, "name": project_key, "team_id": team_id}
+                )
                 stats["projects_created"] += 1
             else:
-                project.team_id = team.id
-
-    db.session.flush()
-
-    # Set up project dependencies
-    for downstream_key, upstream_keys in config.get("project_dependencies", {}).items():
-        downstream = Project.query.filter_by(key=downstream_key).first()
+                project.team_id = team_id
+
+    if new_projects:
+        db.session.execute(insert(Project.__table__), new_projects)
+        existing_projects.update(
+            {
+                p.key: p
+                for p in Project.query.filter(
+                    Project.key.in_([p["key"] for p in new_projects])
+                ).all()
+            }
+        )
+
+    # Set up project dependencies from the prefetched dict
+    for downstream_key, upstream_keys in dependencies.items():
+        downstream = existing_projects.get(downstream_key)
         if downstream:
             for upstream_key in upstream_keys:
-                upstream = Project.query.filter_by(key=upstream_key).first()
+                upstream = existing_projects.get(upstream_key)
                 if upstream and upstream not in downstream.upstream_dependencies:
                     downstream.upstream_dependencies.append(upstream)
 
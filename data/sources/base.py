@@ -82,6 +82,47 @@ class DataSource(ABC):
         """
         pass
 
+    def fetch_tracker_rows(
+        self,
+        project_keys: list[str],
+        since: datetime | None = None,
+    ) -> Iterator[dict]:
+        """Fetch trackers as plain column dicts.
+
+        The bulk sync path consumes these directly, skipping the
+        RawTracker dataclass allocation per issue. Keys match Tracker
+        columns, plus 'project_key' and 'cve_ids' which the sync
+        resolves to foreign keys. Sources may override this to build
+        dicts straight from their payloads; the default adapts
+        fetch_trackers.
+
+        Args:
+            project_keys: List of project keys to fetch (required to avoid unbounded queries).
+            since: Optional datetime to fetch only updated trackers.
+
+        Yields:
+            Column dicts with normalized data.
+        """
+        for raw in self.fetch_trackers(project_keys, since):
+            yield {
+                "jira_key": raw.source_key,
+                "project_key": raw.project_key,
+                "cve_ids": raw.cve_ids,
+                "summary": raw.summary,
+                "status": raw.status,
+                "resolution": raw.resolution,
+                "priority": raw.priority,
+                "severity": raw.severity,
+                "assignee": raw.assignee,
+                "reporter": raw.reporter,
+                "created_date": raw.created_date,
+                "updated_date": raw.updated_date,
+                "resolved_date": raw.resolved_date,
+                "due_date": raw.due_date,
+                "sla_date": raw.sla_date,
+                "downstream_component": raw.downstream_component,
+            }
+
     def fetch_projects(self) -> list[dict]:
         """Fetch available projects from the data source.
 
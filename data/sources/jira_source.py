@@ -1,7 +1,9 @@
 """Jira data source implementation."""
 
 import logging
+import queue
 import re
+import threading
 from datetime import datetime
 from typing import Iterator
 
@@ -17,22 +19,37 @@ class JiraDataSource(DataSource):
 
     SOURCE_TYPE = "jira"
 
-    # Regex pattern to extract CVE IDs from text
-    CVE_PATTERN = re.compile(r"CVE-\d{4}-\d{4,}", re.IGNORECASE)
+    # Regex pattern to extract CVE IDs from text. Matched against
+    # uppercased input with ASCII digits, so the engine skips the
+    # per-character Unicode casefold path entirely.
+    CVE_PATTERN = re.compile(r"CVE-\d{4}-\d{4,}", re.ASCII)
+
+    #: Pages buffered ahead of the consumer during fetch_trackers.
+    PREFETCH_PAGES = 2
+
+    #: Issues per search page. Data Center serves up to 1000 for
+    #: field-limited searches; 500 cuts round trips 5x vs the old 100.
+    PAGE_SIZE = 500
+
+    SEARCH_FIELDS = "summary,status,resolution,priority,assignee,severity,reporter,customfield_12316142,customfield_12326740,customfield_12324752,created,updated,resolutiondate,duedate,project,labels"
 
     def __init__(
         self,
         server: str,
         api_token: str,
+        saved_filter_id: str | None = None,
     ):
         """Initialize Jira data source.
 
         Args:
             server: Jira server URL.
             api_token: Jira API token (Personal Access Token).
+            saved_filter_id: Optional Jira saved filter replacing the
+                labels predicate; its results are memoized server-side.
         """
         self.server = server
         self.api_token = api_token
+        self.saved_filter_id = saved_filter_id
         self._client = None
 
     @property
@@ -85,6 +102,29 @@ class JiraDataSource(DataSource):
         Raises:
             ValueError: If project_keys is empty.
         """
+        for issue in self._iter_issues(project_keys, since):
+            yield self._convert_issue(issue)
+
+    def fetch_tracker_rows(
+        self,
+        project_keys: list[str],
+        since: datetime | None = None,
+    ) -> Iterator[dict]:
+        """Fetch trackers as column dicts, skipping RawTracker objects.
+
+        The bulk sync path reads every field exactly once, so building
+        the dict it ultimately needs avoids a dataclass allocation per
+        issue.
+        """
+        for issue in self._iter_issues(project_keys, since):
+            yield self._convert_issue_row(issue)
+
+    def _iter_issues(
+        self,
+        project_keys: list[str],
+        since: datetime | None = None,
+    ) -> Iterator:
+        """Yield raw Jira issues for the given projects."""
         if not project_keys:
             raise ValueError("project_keys is required - cannot fetch without specifying projects")
 
@@ -94,161 +134,224 @@ class JiraDataSource(DataSource):
         jql_parts.append(f"project IN ({keys_str})")
 
         if since:
-            since_str = since.strftime("%Y-%m-%d %H:%M")
-            jql_parts.append(f'updated >= "{since_str}"')
-            logger.info(f"Incremental sync: fetching issues updated since {since_str}")
+            # Numeric epoch-millis comparison maps straight onto the
+            # server's range index; the quoted date-string form is
+            # parsed per page and planned less efficiently
+            since_ms = int(since.timestamp() * 1000)
+            jql_parts.append(f"updatedDate >= {since_ms}")
+            logger.info(f"Incremental sync: fetching issues updated since {since}")
 
         # Only fetch issues that are likely CVE trackers
         # Adjust this JQL based on how CVE trackers are identified in your Jira
-        jql_parts.append('labels in ("Security", "SecurityTracking")')
+        if self.saved_filter_id:
+            # Saved filter results are cached per-user on the server,
+            # avoiding a labels index scan on every page request
+            jql_parts.append(f"filter = {self.saved_filter_id}")
+        else:
+            jql_parts.append('labels in ("Security", "SecurityTracking")')
 
         jql = " AND ".join(jql_parts)
         logger.info(f"Fetching issues with JQL: {jql}")
 
-        start_at = 0
-        max_results = 100
+        # Pages are fetched on a background thread through a bounded
+        # queue, so the next HTTP round trip overlaps with conversion
+        # and database work on this one. The workload is I/O bound on
+        # Jira REST latency, which this hides almost entirely.
+        page_queue: queue.Queue = queue.Queue(maxsize=self.PREFETCH_PAGES)
+        producer = threading.Thread(
+            target=self._produce_pages,
+            args=(jql, page_queue),
+            name="jira-page-fetcher",
+            daemon=True,
+        )
+        producer.start()
+
         total_fetched = 0
+        while True:
+            page = page_queue.get()
+            if page is None:
+                break
+            if isinstance(page, Exception):
+                raise page
+
+            total_fetched += len(page)
+            logger.info(f"Fetched {len(page)} issues (total: {total_fetched})")
+
+            for issue in page:
+                logger.debug(f"Processing issue: {issue['key']}")
+                yield issue
+
+        producer.join()
+        if total_fetched == 0:
+            logger.warning(f"No issues found matching JQL: {jql}")
+        else:
+            logger.info(f"Reached end of results. Total issues fetched: {total_fetched}")
+
+    def _produce_pages(self, jql: str, page_queue: queue.Queue) -> None:
+        """Fetch result pages and feed them to the queue.
+
+        Runs on the prefetch thread. Pushes one list of issues per
+        page, a caught exception for the consumer to re-raise, or
+        None when the results are exhausted.
+        """
+        start_at = 0
+        max_results = self.PAGE_SIZE
 
         while True:
             logger.info(f"Fetching issues {start_at} to {start_at + max_results}...")
             try:
-                issues = self.client.search_issues(
-                    jql,
-                    startAt=start_at,
-                    maxResults=max_results,
-                    fields="summary,status,resolution,priority,assignee,severity,reporter,customfield_12316142,customfield_12326740,customfield_12324752,created,updated,resolutiondate,duedate,project,labels",
-                )
+                issues, total = self._search_page(jql, start_at, max_results)
             except Exception as e:
                 logger.error(f"Jira search failed: {e}")
-                raise
+                page_queue.put(e)
+                return
 
             if not issues:
-                if total_fetched == 0:
-                    logger.warning(f"No issues found matching JQL: {jql}")
-                else:
-                    logger.info("No more issues to fetch")
                 break
 
-            batch_size = len(issues)
-            total_fetched += batch_size
-            logger.info(f"Fetched {batch_size} issues (total: {total_fetched})")
-
-            for issue in issues:
-                logger.debug(f"Processing issue: {issue.key}")
-                yield self._convert_issue(issue)
-
-            start_at += batch_size
-            if batch_size < max_results:
-                logger.info(f"Reached end of results. Total issues fetched: {total_fetched}")
+            page_queue.put(issues)
+            start_at += len(issues)
+            # A page shorter than PAGE_SIZE may just mean the server
+            # clamps maxResults lower; only the reported total says
+            # whether results are exhausted
+            if start_at >= total:
                 break
 
-    def _convert_issue(self, issue) -> RawTracker:
-        """Convert Jira issue to RawTracker."""
-        fields = issue.fields
-
-        # Log each field name and value for debugging
-        #logger.debug(f"=== Fields for {issue.key} ===")
-        #for field_name in dir(fields):
-        #    if not field_name.startswith('_'):
-        #        try:
-        #            value = getattr(fields, field_name)
-        #            if value is not None and not callable(value):
-        #                logger.debug(f"  {field_name}: {value}")
-        #        except Exception:
-        #            pass
-        #logger.debug("=== End fields ===")
+        page_queue.put(None)
 
-        # Extract CVE IDs from summary and description
-        cve_ids = self._extract_cve_ids(fields.summary or "")
+    def _search_page(self, jql: str, start_at: int, max_results: int) -> tuple[list[dict], int]:
+        """Fetch one page of raw issue dicts from the search REST API.
 
-        if cve_ids:
-            logger.debug(f"Issue {issue.key}: found CVEs {cve_ids}")
-
-        # Extract severity - typically a custom field in Jira
-        # Default to 'Important' if not found
-        severity = self._extract_severity(fields)
-
-        # Extract SLA date - typically a custom field in Jira
-        sla_date = self._extract_sla_date(fields)
-
-        # Extract downstream component name
-        downstream_component = self._extract_downstream_component(fields)
+        Calls the endpoint directly through the client's authenticated
+        session instead of search_issues, so issues arrive as plain
+        dicts rather than the jira library's attribute-proxy objects,
+        whose per-field dispatch dominates conversion cost.
 
+        Returns:
+            The page's issues and the server-reported result total.
+        """
+        response = self.client._session.get(
+            f"{self.server}/rest/api/2/search",
+            params={
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": max_results,
+                "fields": self.SEARCH_FIELDS,
+            },
+        )
+        # Fail with the HTTP status instead of a bare KeyError from an
+        # error body (search_issues raised JIRAError here)
+        response.raise_for_status()
+        data = response.json()
+        return data["issues"], data["total"]
+
+    def _convert_issue(self, issue: dict) -> RawTracker:
+        """Convert a Jira issue dict to RawTracker."""
+        row = self._convert_issue_row(issue)
         return RawTracker(
-            source_key=issue.key,
+            source_key=row.pop("jira_key"),
             source_type=self.SOURCE_TYPE,
-            project_key=fields.project.key,
-            summary=fields.summary,
-            status=fields.status.name if fields.status else None,
-            resolution=fields.resolution.name if fields.resolution else None,
-            priority=fields.priority.name if fields.priority else None,
-            severity=severity,
-            assignee=fields.assignee.displayName if fields.assignee else None,
-            reporter=fields.reporter.displayName if fields.reporter else None,
-            created_date=self._parse_date(fields.created),
-            updated_date=self._parse_date(fields.updated),
-            resolved_date=self._parse_date(fields.resolutiondate),
-            due_date=self._parse_date(fields.duedate),
-            sla_date=sla_date,
-            downstream_component=downstream_component,
-            cve_ids=cve_ids,
-            labels=[str(label) for label in (fields.labels or [])],
+            labels=[str(label) for label in (issue["fields"].get("labels") or [])],
+            **row,
         )
 
-    def _extract_severity(self, fields) -> str:
+    def _convert_issue_row(self, issue: dict) -> dict:
+        """Convert a Jira issue dict to a sync column dict.
+
+        Issues arrive as the raw REST payload, so every read here is a
+        plain dict lookup with no proxy-object dispatch.
+        """
+        fields = issue["fields"]
+        summary = fields.get("summary")
+
+        # Extract CVE IDs from summary and description
+        cve_ids = self._extract_cve_ids(summary or "")
+
+        if cve_ids:
+            logger.debug(f"Issue {issue['key']}: found CVEs {cve_ids}")
+
+        return {
+            "jira_key": issue["key"],
+            "project_key": fields["project"]["key"],
+            "cve_ids": cve_ids,
+            "summary": summary,
+            "status": (fields.get("status") or {}).get("name"),
+            "resolution": (fields.get("resolution") or {}).get("name"),
+            "priority": (fields.get("priority") or {}).get("name"),
+            # Severity, SLA date and downstream component live in
+            # custom fields
+            "severity": self._extract_severity(fields),
+            "assignee": (fields.get("assignee") or {}).get("displayName"),
+            "reporter": (fields.get("reporter") or {}).get("displayName"),
+            "created_date": self._parse_date(fields.get("created")),
+            "updated_date": self._parse_date(fields.get("updated")),
+            "resolved_date": self._parse_date(fields.get("resolutiondate")),
+            "due_date": self._parse_date(fields.get("duedate")),
+            "sla_date": self._extract_sla_date(fields),
+            "downstream_component": self._extract_downstream_component(fields),
+        }
+
+    def _extract_severity(self, fields: dict) -> str | None:
         """Extract severity from Jira fields.
 
         Severity is often a custom field. This method checks common locations.
         """
         # Check for customfield_12316142 (common Red Hat severity field)
-        severity_field = getattr(fields, "customfield_12316142", None)
-        if severity_field:
-            # Could be a dict with 'value' or 'name', or a string
-            if hasattr(severity_field, "value"):
-                return severity_field.value
-            elif hasattr(severity_field, "name"):
-                return severity_field.name
-            elif isinstance(severity_field, str):
-                return severity_field
-
-
-    def _extract_sla_date(self, fields) -> datetime | None:
+        return self._option_value(fields.get("customfield_12316142"))
+
+    def _extract_sla_date(self, fields: dict) -> datetime | None:
         """Extract SLA date from Jira fields.
 
         SLA date is typically stored in a custom field.
         """
         # Check for customfield_12326740 (common Red Hat SLA date field)
-        sla_field = getattr(fields, "customfield_12326740", None)
+        sla_field = fields.get("customfield_12326740")
         if sla_field:
             return self._parse_date(sla_field)
 
         return None
 
-    def _extract_downstream_component(self, fields) -> str | None:
+    def _extract_downstream_component(self, fields: dict) -> str | None:
         """Extract downstream component name from Jira fields."""
-        component_field = getattr(fields, "customfield_12324752", None)
-        if component_field:
-            if hasattr(component_field, "value"):
-                return component_field.value
-            elif hasattr(component_field, "name"):
-                return component_field.name
-            elif isinstance(component_field, str):
-                return component_field
+        return self._option_value(fields.get("customfield_12324752"))
+
+    @staticmethod
+    def _option_value(field) -> str | None:
+        """Unwrap a custom field that may be an option dict or a string."""
+        if isinstance(field, dict):
+            return field.get("value") or field.get("name")
+        if isinstance(field, str):
+            return field
         return None
 
     def _extract_cve_ids(self, text: str) -> list[str]:
         """Extract CVE IDs from text."""
-        matches = self.CVE_PATTERN.findall(text)
-        return [cve.upper() for cve in set(matches)]
+        # Uppercase once instead of a case-insensitive scan, then the
+        # literal prefilter runs at memchr speed and lets summaries
+        # without a CVE reference skip the regex entirely
+        text = text.upper()
+        if "CVE-" not in text:
+            return []
+        # dict.fromkeys dedups in one pass while keeping match order,
+        # so the primary CVE is deterministic
+        return list(dict.fromkeys(self.CVE_PATTERN.findall(text)))
 
     def _parse_date(self, date_str: str | None) -> datetime | None:
         """Parse Jira date string to datetime."""
         if not date_str:
             return None
+        # Jira returns ISO format dates; fromisoformat accepts the Z
+        # suffix directly on Python 3.11+, so the common path makes no
+        # string copy. The replace fallback keeps 3.10 working.
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+        except (AttributeError, TypeError):
+            return None
         try:
-            # Jira returns ISO format dates
             return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+        except ValueError:
             return None
 
     def fetch_projects(self) -> list[dict]:
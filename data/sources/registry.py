@@ -3,11 +3,19 @@
 from typing import Type
 from data.sources.base import DataSource
 
+# Shared with SourceRegistry; module-level so hot paths can bind
+# get_source directly instead of going through two attribute lookups
+_sources: dict[str, Type[DataSource]] = {}
+
+#: Plain-function lookup for dispatch paths: one global load plus a
+#: C-level dict get per call.
+get_source = _sources.get
+
 
 class SourceRegistry:
     """Registry for data source implementations."""
 
-    _sources: dict[str, Type[DataSource]] = {}
+    _sources = _sources
 
     @classmethod
     def register(cls, source_class: Type[DataSource]) -> Type[DataSource]:
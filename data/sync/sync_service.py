@@ -1,10 +1,12 @@
 """Synchronization service for data sources."""
 
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
-from data.sources.base import DataSource, RawTracker
+from data.sources.base import DataSource
 
 if TYPE_CHECKING:
     from flask import Flask
@@ -15,6 +17,15 @@ logger = logging.getLogger(__name__)
 class SyncService:
     """Service for synchronizing data from external sources to the database."""
 
+    #: Trackers buffered before each bulk upsert.
+    BATCH_SIZE = 1000
+
+    #: Project keys fetched per concurrent source stream.
+    PROJECT_CHUNK_SIZE = 20
+
+    #: Concurrent fetch streams when there are multiple chunks.
+    FETCH_WORKERS = 4
+
     def __init__(self, app: "Flask | None" = None):
         """Initialize sync service.
 
@@ -61,19 +72,33 @@ class SyncService:
             "errors": [],
         }
 
-        processed = 0
-        for raw_tracker in source.fetch_trackers(project_keys, since):
-            try:
-                self._process_tracker(raw_tracker, stats, db, CVE, Project, Tracker)
-                processed += 1
-                if processed % 50 == 0:
-                    logger.info(f"Processed {processed} trackers...")
-            except Exception as e:
-                logger.warning(f"Error processing {raw_tracker.source_key}: {e}")
-                stats["errors"].append(f"{raw_tracker.source_key}: {str(e)}")
+        # Per-sync id caches: primed once, kept current as batches
+        # create rows, so repeated project/CVE references cost nothing.
+        # Both are bounded by the distinct keys seen in one sync.
+        project_ids: dict[str, int] = dict(
+            db.session.query(Project.key, Project.id)
+            .filter(Project.key.in_(project_keys))
+            .all()
+        )
+        cve_ids: dict[str, int] = {}
 
-        logger.info(f"Committing {processed} trackers to database...")
-        db.session.commit()
+        # One timestamp for the whole sync; every upserted row shares it
+        sync_ts = datetime.utcnow()
+
+        processed = 0
+        batch: list[dict] = []
+        for row in self._iter_rows(source, project_keys, since, stats):
+            batch.append(row)
+            if len(batch) >= self.BATCH_SIZE:
+                processed += self._flush_batch(
+                    batch, stats, sync_ts, project_ids, cve_ids, db, CVE, Project, Tracker
+                )
+                logger.info(f"Processed {processed} trackers...")
+                batch = []
+        if batch:
+            processed += self._flush_batch(
+                batch, stats, sync_ts, project_ids, cve_ids, db, CVE, Project, Tracker
+            )
 
         logger.info(
             f"Sync complete: {stats['trackers_created']} created, "
@@ -84,61 +109,194 @@ class SyncService:
 
         return stats
 
-    def _process_tracker(
+    def _iter_rows(
+        self,
+        source: DataSource,
+        project_keys: list[str],
+        since: datetime | None,
+        stats: dict,
+    ) -> Iterator[dict]:
+        """Yield tracker rows, fetching project chunks concurrently.
+
+        A handful of projects streams serially. Larger sets are split
+        into chunks fetched on worker threads that feed a bounded
+        queue, so several HTTP streams run at once while this thread
+        (and the SQLAlchemy session) stays the single consumer. A
+        failed chunk is recorded in stats errors; the others proceed.
+        """
+        if len(project_keys) <= self.PROJECT_CHUNK_SIZE:
+            yield from source.fetch_tracker_rows(project_keys, since)
+            return
+
+        chunks = [
+            project_keys[i : i + self.PROJECT_CHUNK_SIZE]
+            for i in range(0, len(project_keys), self.PROJECT_CHUNK_SIZE)
+        ]
+        logger.info(f"Fetching {len(chunks)} project chunks concurrently")
+
+        done = object()
+        row_queue: queue.Queue = queue.Queue(maxsize=self.BATCH_SIZE * 2)
+
+        def drain(chunk: list[str]) -> None:
+            try:
+                for row in source.fetch_tracker_rows(chunk, since):
+                    row_queue.put(row)
+            except Exception as e:
+                logger.error(f"Fetch failed for projects {chunk}: {e}")
+                row_queue.put(e)
+            finally:
+                row_queue.put(done)
+
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as pool:
+            for chunk in chunks:
+                pool.submit(drain, chunk)
+
+            remaining = len(chunks)
+            while remaining:
+                item = row_queue.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    stats["errors"].append(f"fetch: {str(item)}")
+                else:
+                    yield item
+
+    def _flush_batch(
         self,
-        raw: RawTracker,
+        batch: list[dict],
         stats: dict,
+        sync_ts: datetime,
+        project_ids: dict[str, int],
+        cve_ids: dict[str, int],
         db,
         CVE,
         Project,
         Tracker,
-    ) -> None:
-        """Process a single raw tracker into database records."""
-        # Get or create project
-        project = Project.query.filter_by(key=raw.project_key).first()
-        if not project:
-            project = Project(key=raw.project_key, name=raw.project_key)
-            db.session.add(project)
-            db.session.flush()
-            stats["projects_created"] += 1
-            logger.debug(f"Created project: {raw.project_key}")
-
-        # Get or create CVEs
-        cve = None
-        for cve_id in raw.cve_ids:
-            existing_cve = CVE.query.filter_by(cve_id=cve_id).first()
-            if not existing_cve:
-                existing_cve = CVE(cve_id=cve_id)
-                db.session.add(existing_cve)
-                db.session.flush()
-                stats["cves_created"] += 1
-                logger.debug(f"Created CVE: {cve_id}")
-            cve = existing_cve  # Link to the first/primary CVE
-
-        # Get or create tracker
-        tracker = Tracker.query.filter_by(jira_key=raw.source_key).first()
-        if tracker:
-            stats["trackers_updated"] += 1
-        else:
-            tracker = Tracker(jira_key=raw.source_key)
-            db.session.add(tracker)
-            stats["trackers_created"] += 1
-            logger.debug(f"Created tracker: {raw.source_key}")
-
-        # Update tracker fields
-        tracker.project_id = project.id
-        tracker.cve_id = cve.id if cve else None
-        tracker.summary = raw.summary
-        tracker.status = raw.status
-        tracker.resolution = raw.resolution
-        tracker.priority = raw.priority
-        tracker.severity = raw.severity
-        tracker.assignee = raw.assignee
-        tracker.reporter = raw.reporter
-        tracker.created_date = raw.created_date
-        tracker.updated_date = raw.updated_date
-        tracker.resolved_date = raw.resolved_date
-        tracker.due_date = raw.due_date
-        tracker.sla_date = raw.sla_date
-        tracker.downstream_component = raw.downstream_component
-        tracker.last_synced_at = datetime.utcnow()
+    ) -> int:
+        """Bulk-upsert a batch of tracker column dicts.
+
+        Projects and CVEs are resolved through the per-sync id caches;
+        only keys the caches have not seen cost an IN query plus one
+        bulk insert. All trackers then go through a single
+        INSERT ... ON CONFLICT statement keyed on jira_key. The old
+        per-tracker version issued three SELECTs and an ORM
+        add/update per row.
+
+        Each batch commits on its own, so a failure costs exactly this
+        batch: earlier batches are already durable, and the rolled-back
+        project/CVE inserts are evicted from the id caches so a later
+        batch recreates them instead of referencing missing rows.
+
+        Returns:
+            Number of trackers upserted, 0 if the batch failed.
+        """
+        from sqlalchemy import insert
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        # Project/CVE keys inserted by this batch, for cache eviction
+        # if it rolls back
+        batch_projects: list[str] = []
+        batch_cves: list[str] = []
+
+        try:
+            # Resolve (and create missing) projects not already cached
+            new_project_keys = {
+                row["project_key"] for row in batch
+            } - project_ids.keys()
+            if new_project_keys:
+                project_ids.update(
+                    db.session.query(Project.key, Project.id)
+                    .filter(Project.key.in_(new_project_keys))
+                    .all()
+                )
+                missing_projects = sorted(new_project_keys - project_ids.keys())
+                if missing_projects:
+                    db.session.execute(
+                        insert(Project.__table__),
+                        [{"key": key, "name": key} for key in missing_projects],
+                    )
+                    batch_projects = missing_projects
+                    project_ids.update(
+                        db.session.query(Project.key, Project.id)
+                        .filter(Project.key.in_(missing_projects))
+                        .all()
+                    )
+
+            # Resolve (and create missing) CVEs not already cached
+            new_cve_keys = {
+                cve_id for row in batch for cve_id in row["cve_ids"]
+            } - cve_ids.keys()
+            if new_cve_keys:
+                cve_ids.update(
+                    db.session.query(CVE.cve_id, CVE.id)
+                    .filter(CVE.cve_id.in_(new_cve_keys))
+                    .all()
+                )
+                missing_cves = sorted(new_cve_keys - cve_ids.keys())
+                if missing_cves:
+                    db.session.execute(
+                        insert(CVE.__table__),
+                        [{"cve_id": cve_id} for cve_id in missing_cves],
+                    )
+                    batch_cves = missing_cves
+                    cve_ids.update(
+                        db.session.query(CVE.cve_id, CVE.id)
+                        .filter(CVE.cve_id.in_(missing_cves))
+                        .all()
+                    )
+
+            # Created vs updated split, from one membership query
+            existing_keys = {
+                key
+                for (key,) in db.session.query(Tracker.jira_key).filter(
+                    Tracker.jira_key.in_([row["jira_key"] for row in batch])
+                )
+            }
+
+            # Resolve the lookup keys to foreign keys in place; the
+            # rest of each dict is already column-shaped
+            for row in batch:
+                row["project_id"] = project_ids[row.pop("project_key")]
+                # Link to the primary CVE (last listed, matching the
+                # previous per-row behavior)
+                row_cve_ids = row.pop("cve_ids")
+                row["cve_id"] = cve_ids[row_cve_ids[-1]] if row_cve_ids else None
+                # Core inserts bypass the @validates normalizer
+                if row["severity"]:
+                    row["severity"] = row["severity"].lower()
+                row["last_synced_at"] = sync_ts
+                # The column's onupdate is ORM-level and doesn't fire
+                # for Core statements; staleness keys depend on it
+                row["updated_at"] = sync_ts
+            rows = batch
+
+            stmt = sqlite_insert(Tracker.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["jira_key"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in rows[0]
+                    if column != "jira_key"
+                },
+            )
+            db.session.execute(stmt, rows)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            # The rollback discarded this batch's project/CVE inserts;
+            # drop their cached ids so later batches recreate the rows
+            for key in batch_projects:
+                project_ids.pop(key, None)
+            for key in batch_cves:
+                cve_ids.pop(key, None)
+            first, last = batch[0]["jira_key"], batch[-1]["jira_key"]
+            logger.warning(f"Error processing batch {first}..{last}: {e}")
+            stats["errors"].append(f"batch {first}..{last}: {str(e)}")
+            return 0
+
+        # Stats only count what actually committed
+        stats["projects_created"] += len(batch_projects)
+        stats["cves_created"] += len(batch_cves)
+        stats["trackers_updated"] += len(existing_keys)
+        stats["trackers_created"] += len(batch) - len(existing_keys)
+        return len(batch)
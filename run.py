@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
-"""Entry point for the CaseLoad application."""
+"""Entry point for the CaseLoad application.
+
+Module-level app is the WSGI callable for production servers
+(``gunicorn run:app``); running this file directly starts the Werkzeug
+development server, which handles one request at a time and carries
+debugger/reloader overhead per request.
+"""
 
 from app import create_app
 
 app = create_app()
 
 
-def main():
-    """Run the application."""
+def main_dev():
+    """Run the development server."""
     app.run(debug=True)
 
 
 if __name__ == "__main__":
-    main()
+    main_dev()
@@ -1,6 +1,9 @@
 """Pytest fixtures for CaseLoad tests."""
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
 from app import create_app
 from app.extensions import db as _db
 
@@ -9,14 +12,71 @@ from app.extensions import db as _db
 def app():
     """Create application for testing."""
     app = create_app("testing")
-    return app
+    with app.app_context():
+        # pysqlite's lazy transaction handling breaks SAVEPOINT; take
+        # over BEGIN emission so the rollback fixture works (see the
+        # "Serializable isolation / Savepoints" note in the SQLAlchemy
+        # pysqlite docs)
+        @event.listens_for(_db.engine, "connect")
+        def _do_connect(dbapi_connection, _record):
+            dbapi_connection.isolation_level = None
 
+        @event.listens_for(_db.engine, "begin")
+        def _do_begin(connection):
+            connection.exec_driver_sql("BEGIN")
 
-@pytest.fixture(scope="function")
-def db(app):
-    """Create database for testing."""
+        _db.create_all()
+    yield app
     with app.app_context():
-        yield _db
+        _db.drop_all()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_ctx(app):
+    """Keep one application context pushed for the whole session.
+
+    Entering a context per test repays config lookup and teardown
+    bookkeeping every time; tests that need request state use req_ctx
+    on top of this.
+    """
+    with app.app_context():
+        yield
+
+
+@pytest.fixture
+def req_ctx(app):
+    """Push a test request context for tests that need one."""
+    with app.test_request_context():
+        yield
+
+
+@pytest.fixture(scope="function")
+def db(app, app_ctx):
+    """Database handle inside a transaction rolled back after the test.
+
+    The schema is built once per session by the app fixture; each test
+    runs on a dedicated connection whose outer transaction is rolled
+    back at teardown, so isolation costs a savepoint instead of
+    drop/create DDL. Session-level commit() releases savepoints only,
+    never the outer transaction.
+    """
+    connection = _db.engine.connect()
+    transaction = connection.begin()
+
+    # Plain scoped session: Flask-SQLAlchemy's session class picks
+    # its bind per model and would ignore the dedicated connection
+    session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    )
+    original_session = _db.session
+    _db.session = session
+
+    yield _db
+
+    _db.session = original_session
+    session.remove()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture